@@ -17,34 +17,37 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 import os
-import subprocess
+import re
 import sys
 
+# Modules that shadow a dist-package and should be excluded from mypy
+SHADOWED_MODULES = [
+    "typing_extensions", "mypy_extensions"
+]
+_SHADOWED_MODULE_PATTERN = re.compile("|".join(map(re.escape, SHADOWED_MODULES)))
+
 
 def shadowed_module(path: str) -> bool:
     """ Whether a path indicates a module that shadows a dist-package and should be excluded from
     mypy """
-    shadowed_modules = [
-        "typing_extensions", "mypy_extensions"
-    ]
-    return any(module in path for module in shadowed_modules)
+    return _SHADOWED_MODULE_PATTERN.search(path) is not None
 
 
 def main():
     # Determine the module include paths that should be used by mypy
     paths = os.environ["PYTHONPATH"]
     fixed_paths = ":".join(path for path in paths.split(":") if not shadowed_module(path))
-    env = {
-        "PYTHONPATH": paths,
-        "MYPYPATH": fixed_paths
-    }
-
-    # Run mypy in a subprocess
-    result = subprocess.run([sys.executable, "-m", "mypy",
-                             "--explicit-package-bases", "--namespace-packages",
-                             "--follow-imports", "silent", "--check-untyped-defs"] + sys.argv[1:],
-                            env=env)
-    sys.exit(result.returncode)
+    # Keep the rest of the environment, such as HOME and MYPY_CACHE_DIR, so mypy can find and
+    # reuse its incremental cache
+    env = os.environ.copy()
+    env["PYTHONPATH"] = paths
+    env["MYPYPATH"] = fixed_paths
+
+    # Replace this process with mypy, so its exit code is returned directly
+    args = [sys.executable, "-m", "mypy",
+            "--explicit-package-bases", "--namespace-packages",
+            "--follow-imports", "silent", "--check-untyped-defs"] + sys.argv[1:]
+    os.execvpe(sys.executable, args, env)
 
 
 if __name__ == "__main__":
@@ -16,19 +16,51 @@ limitations under the License.
 
 SPDX-License-Identifier: Apache-2.0
 """
-from typing import Dict, List, Type
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Type
 
-from cloud_common.objects.mission import MissionObjectV1
 from cloud_common.objects.object import ApiObject, ApiObjectMethod, ObjectLifecycleV1
-from cloud_common.objects.robot import RobotObjectV1
-from cloud_common.objects.detection_results import DetectionResultsObjectV1
 
-ALL_OBJECTS: List[Type[ApiObject]] = [
-    RobotObjectV1, MissionObjectV1, DetectionResultsObjectV1]
-OBJECT_DICT: Dict[str, Type[ApiObject]] = {
-    obj.get_alias(): obj for obj in ALL_OBJECTS}
+if TYPE_CHECKING:
+    from cloud_common.objects.mission import MissionObjectV1
+    from cloud_common.objects.robot import RobotObjectV1
+    from cloud_common.objects.detection_results import DetectionResultsObjectV1
 
-USER_API_OBJECT_DICT: Dict[str, Type[ApiObject]] = {
-    obj.get_alias(): obj for obj in ALL_OBJECTS if obj is not DetectionResultsObjectV1}
+    ALL_OBJECTS: List[Type[ApiObject]]
+    OBJECT_DICT: Dict[str, Type[ApiObject]]
+    USER_API_OBJECT_DICT: Dict[str, Type[ApiObject]]
 
 ApiObjectType = Type[ApiObject]
+
+# The object modules are only imported when they are first used, so that importing one of them
+# does not also build the models of all the others
+_OBJECT_MODULES = {
+    "MissionObjectV1": "cloud_common.objects.mission",
+    "RobotObjectV1": "cloud_common.objects.robot",
+    "DetectionResultsObjectV1": "cloud_common.objects.detection_results",
+}
+
+
+def _load_objects() -> Dict[str, Any]:
+    object_classes = {name: getattr(importlib.import_module(module), name)
+                      for name, module in _OBJECT_MODULES.items()}
+    all_objects: List[Type[ApiObject]] = [
+        object_classes["RobotObjectV1"], object_classes["MissionObjectV1"],
+        object_classes["DetectionResultsObjectV1"]]
+    return {
+        **object_classes,
+        "ALL_OBJECTS": all_objects,
+        "OBJECT_DICT": {obj.ALIAS: obj for obj in all_objects},
+        "USER_API_OBJECT_DICT": {
+            obj.ALIAS: obj for obj in all_objects
+            if obj is not object_classes["DetectionResultsObjectV1"]},
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _OBJECT_MODULES and \
+            name not in ("ALL_OBJECTS", "OBJECT_DICT", "USER_API_OBJECT_DICT"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Store the loaded values as module attributes so this is only called once
+    globals().update(_load_objects())
+    return globals()[name]
@@ -18,6 +18,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 import enum
 
+import orjson
 import pydantic
 
 # Tell pylint to ignore the invalid names. We must use fields that are specified
@@ -53,6 +54,25 @@ class ICSServerError(ICSError):
     error_code: str = "SERVER"
 
 
+def orjson_dumps(value, *, default) -> str:
+    # pydantic expects a str, but orjson produces bytes
+    return orjson.dumps(value, default=default).decode()
+
+
+class JsonModel(pydantic.BaseModel):
+    """Base class for models that are serialized to and from JSON when they are sent through the
+    API or stored in the database"""
+
+    class Config:
+        json_loads = orjson.loads
+        json_dumps = orjson_dumps
+
+    def json_bytes(self) -> bytes:
+        """Serializes the model like json(), but returns the UTF-8 encoded bytes orjson produces
+        instead of decoding them to a str"""
+        return orjson.dumps(self.dict(), default=self.__json_encoder__)
+
+
 class TaskType(enum.Enum):
     MISSION = "MISSION"
     MAP_UPDATE = "MAP_UPDATE"
@@ -21,28 +21,39 @@ from typing import Any, Dict, List, Optional
 
 import pydantic
 
-from cloud_common.objects import object
+from cloud_common.objects import common, object
 
 
-class Point3D(pydantic.BaseModel):
+class GeometryModel(pydantic.BaseModel):
+    """Base class for the small geometry value types that are created in bulk for every
+    detected object"""
+
+    class Config:
+        # Geometry values are immutable, so they can be shared instead of copied when they are
+        # used to build another model
+        allow_mutation = False
+        copy_on_model_validation = False
+
+
+class Point3D(GeometryModel):
     x: float = 0
     y: float = 0
     z: float = 0
 
 
-class Quaternion(pydantic.BaseModel):
+class Quaternion(GeometryModel):
     w: float = 0
     x: float = 0
     y: float = 0
     z: float = 0
 
 
-class Pose3D(pydantic.BaseModel):
+class Pose3D(GeometryModel):
     position: Point3D
     orientation: Quaternion
 
 
-class DetectedObjectCenter2D(pydantic.BaseModel):
+class DetectedObjectCenter2D(GeometryModel):
     x: float = 0
     y: float = 0
     theta: float = 0
@@ -68,16 +79,15 @@ class DetectedObject(pydantic.BaseModel):
     object_id: int = 0
     class_id: str = ''
 
-    @pydantic.root_validator
+    @pydantic.root_validator(skip_on_failure=True)
     def check_f1_f2(cls, values):
-        bbox_2d = values.get('bbox2d')
-        bbox_3d = values.get('bbox3d')
-        if bbox_2d is None and bbox_3d is None:
+        # Both fields are always present once the fields validated successfully
+        if values['bbox2d'] is None and values['bbox3d'] is None:
             raise ValueError('Either bbox2d or bbox3d must be provided.')
         return values
 
 
-class DetectionResultsStatusV1(pydantic.BaseModel):
+class DetectionResultsStatusV1(common.JsonModel):
     """Represents the status of the robot's object detector."""
     # A string containing JSON information about all detected
     # objects associated with the paired robot
@@ -88,7 +98,7 @@ class DetectionResultsStatusV1(pydantic.BaseModel):
     detected_objects: List[DetectedObject] = []
 
 
-class DetectionResultsSpecV1(pydantic.BaseModel):
+class DetectionResultsSpecV1(common.JsonModel):
     """Specifies constant properties about the object detector, such as its name."""
     pass
 
@@ -102,9 +112,7 @@ class DetectionResultsObjectV1(DetectionResultsSpecV1, object.ApiObject):
     """Represents an object detector."""
     status: DetectionResultsStatusV1 = DetectionResultsStatusV1()
 
-    @classmethod
-    def get_alias(cls) -> str:
-        return 'detection_results'
+    ALIAS = 'detection_results'
 
     @classmethod
     def get_spec_class(cls) -> Any:
@@ -122,12 +130,6 @@ class DetectionResultsObjectV1(DetectionResultsSpecV1, object.ApiObject):
     def get_query_params(cls) -> Any:
         return DetectionResultsQueryParamsV1
 
-    @staticmethod
-    def get_query_map() -> Dict:
-        return {
-
-        }
-
     @classmethod
     def supports_spec_update(cls) -> bool:
         return False
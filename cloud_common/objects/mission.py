@@ -18,6 +18,7 @@ SPDX-License-Identifier: Apache-2.0
 """
 import datetime
 import enum
+import itertools
 from typing import Any, Dict, List, Optional
 
 import pydantic
@@ -35,6 +36,29 @@ class MissionNodeType(str, enum.Enum):
     CONSTANT = "constant"
 
 
+# Field names that select the type of a mission node / move node
+_MISSION_NODE_TYPE_VALUES = tuple(e.value for e in MissionNodeType)
+_MISSION_MOVE_TYPES = ("distance", "rotation")
+
+# How long a mission is allowed to run by default
+_DEFAULT_MISSION_TIMEOUT = datetime.timedelta(seconds=300)
+
+
+def _validate_exactly_one_set(values: Dict[str, Any], types):
+    # Stop as soon as a second field is found, the full list is only needed for the error
+    num_set = 0
+    for type in types:
+        if values.get(type) is not None:
+            num_set += 1
+            if num_set > 1:
+                break
+    if num_set != 1:
+        set_types = [type for type in types if values.get(type) is not None]
+        raise common.ICSUsageError("Exactly one of the following must be set "
+                                   f"{list(types)}, "
+                                   f"but the following {len(set_types)} are set {set_types}")
+
+
 class MissionStateV1(str, enum.Enum):
     """Enum defining the state of the mission."""
     # The mission has not yet been started
@@ -50,7 +74,12 @@ class MissionStateV1(str, enum.Enum):
 
     @property
     def done(self):
-        return self in (self.COMPLETED, self.FAILED, self.CANCELED)
+        return self in _MISSION_DONE_STATES
+
+
+# The terminal mission states
+_MISSION_DONE_STATES = frozenset(
+    (MissionStateV1.COMPLETED, MissionStateV1.FAILED, MissionStateV1.CANCELED))
 
 
 class MissionFailureCategoryV1(str, enum.Enum):
@@ -142,17 +171,13 @@ class MissionMoveNodeV1(pydantic.BaseModel):
             This value is in radians. If not specified, there is no rotational movement.
     """
     distance: Optional[float] = pydantic.Field(
-        description="The distance that robot needs to move")
+        None, description="The distance that robot needs to move")
     rotation: Optional[float] = pydantic.Field(
-        description="The relative rotation that robot needs to move in radians")
+        None, description="The relative rotation that robot needs to move in radians")
 
     @pydantic.root_validator
     def validate_mission_move_node_type(cls, values):
-        types = ["distance", "rotation"]
-        set_types = [type for type in types if values.get(type) is not None]
-        if len(set_types) != 1:
-            raise common.ICSUsageError(f"Exactly one of the following must be set {types}, "
-                                       f"but the following {len(set_types)} are set {set_types}")
+        _validate_exactly_one_set(values, _MISSION_MOVE_TYPES)
         return values
 
 
@@ -184,13 +209,13 @@ class MissionNodeV1(pydantic.BaseModel):
     parent: str = pydantic.Field(
         "root", description="A parent for the node")
     route: Optional[MissionRouteNodeV1] = pydantic.Field(
-        description="A list of poses for the robot to complete.")
+        None, description="A list of poses for the robot to complete.")
     move: Optional[MissionMoveNodeV1] = pydantic.Field(
-        description="A distance or relative rotation for the robot to complete.")
+        None, description="A distance or relative rotation for the robot to complete.")
     action: Optional[MissionActionNodeV1] = pydantic.Field(
-        description="An action for the robot to complete.")
+        None, description="An action for the robot to complete.")
     notify: Optional[MissionNotifyNodeV1] = pydantic.Field(
-        description="An API for Dispatch to call.")
+        None, description="An API for Dispatch to call.")
     selector: Optional[Dict] = pydantic.Field(
         None, description="When started, this node will start its first child. If the child \
             currently running returns FAILED, start the next child. If all children fail, \
@@ -201,24 +226,21 @@ class MissionNodeV1(pydantic.BaseModel):
             currently running returns SUCCESS, start the next child. If all children succeed, \
             this node returns SUCCESS. If any child fails, this node immediately returns FAILURE.")
     constant: Optional[MissionConstantNodeV1] = pydantic.Field(
-        description="A boolean describing the whether the node status should be a success \
+        None, description="A boolean describing the whether the node status should be a success \
             or failure when started")
 
     @pydantic.root_validator
     def validate_mission_node_type(cls, values):
-        types = [e.value for e in MissionNodeType]
-        set_types = [type for type in types if values.get(type) is not None]
-        if len(set_types) != 1:
-            raise common.ICSUsageError(f"Exactly one of the following must be set {types}, "
-                                       f"but the following {len(set_types)} are set {set_types}")
+        _validate_exactly_one_set(values, _MISSION_NODE_TYPE_VALUES)
         return values
 
     @property
     def type(self):
-        dict_set = self.dict(exclude_unset=True, exclude_none=True)
+        # Check the node type fields directly instead of serializing the whole node
         for node_type in MissionNodeType:
-            if node_type.value in dict_set:
+            if getattr(self, node_type.value) is not None:
                 return node_type
+        return None
 
     @classmethod
     def get_field_description(cls, field):
@@ -226,26 +248,28 @@ class MissionNodeV1(pydantic.BaseModel):
 
     @classmethod
     def get_supported_behaviors(cls):
-        behaviors = []
-        behavior_class_map = {
-            "route": MissionRouteNodeV1,
-            "move": MissionMoveNodeV1,
-            "action": MissionActionNodeV1,
-            "notify": MissionNotifyNodeV1,
-            "constant": MissionConstantNodeV1
-        }
-        for k, v in behavior_class_map.items():
-            behaviors.append(
-                {"name": k, "params": list(getattr(v, "__fields__", {}).keys()),
-                 "description": v.__doc__})
-        behaviors.append({"name": "sequence", "params": [],
-                          "description": cls.get_field_description("sequence")})
-        behaviors.append({"name": "selector", "params": [],
-                          "description": cls.get_field_description("selector")})
-        return behaviors
-
-
-class MissionSpecV1(pydantic.BaseModel):
+        return _SUPPORTED_BEHAVIORS
+
+
+# The supported behaviors only depend on the class definitions, so they are built once at import.
+# The list is shared by every caller and must not be modified
+_SUPPORTED_BEHAVIORS = [
+    {"name": name, "params": list(node_class.__fields__.keys()),
+     "description": node_class.__doc__}
+    for name, node_class in (("route", MissionRouteNodeV1),
+                             ("move", MissionMoveNodeV1),
+                             ("action", MissionActionNodeV1),
+                             ("notify", MissionNotifyNodeV1),
+                             ("constant", MissionConstantNodeV1))
+] + [
+    {"name": "sequence", "params": [],
+     "description": MissionNodeV1.get_field_description("sequence")},
+    {"name": "selector", "params": [],
+     "description": MissionNodeV1.get_field_description("selector")},
+]
+
+
+class MissionSpecV1(common.JsonModel):
     """Specifies which robot the mission is assigned to and which orders must be completed for
     the mission."""
     robot: str = pydantic.Field(
@@ -253,7 +277,7 @@ class MissionSpecV1(pydantic.BaseModel):
     mission_tree: List[MissionNodeV1] = pydantic.Field(
         description="A list of nodes (tasks) for the robot to complete.")
     timeout: datetime.timedelta = pydantic.Field(
-        datetime.timedelta(seconds=300),
+        _DEFAULT_MISSION_TIMEOUT,
         description="How long the mission is allowed to run before giving up.")
     deadline: Optional[datetime.datetime] = pydantic.Field(
         description="When the mission must complete by before it is canceled.")
@@ -268,24 +292,26 @@ class MissionSpecV1(pydantic.BaseModel):
         if len(value) < 1:
             raise common.ICSUsageError("Number of nodes must be >= 1")
 
-        name_set = set(["root"])
+        name_set = {"root"}
+        add_name = name_set.add
         for i, node in enumerate(value):
+            name = node.name
             # If no name is provided, assign a default
-            if node.name is None:
-                node.name = str(i)
+            if name is None:
+                name = node.name = str(i)
             # Make sure all names are unique
-            if node.name in name_set:
+            if name in name_set:
                 raise common.ICSUsageError(
-                    f"MissionNode name {node.name} is repeated. All MissionNode names"
+                    f"MissionNode name {name} is repeated. All MissionNode names"
                     "must be unique.")
             # Make sure the parent appears and it is before the child. This ensures there are no
             # cycles
             if node.parent not in name_set:
                 raise common.ICSUsageError(
-                    f"MissionNode \"{node.name}\" has parent \"{node.parent}\" which"
+                    f"MissionNode \"{name}\" has parent \"{node.parent}\" which"
                     " does not appear before it in the mission_tree.")
 
-            name_set.add(node.name)
+            add_name(name)
 
         return value
 
@@ -296,7 +322,7 @@ class MissionNodeStatusV1(pydantic.BaseModel):
     error_msg: Optional[str] = None
 
 
-class MissionStatusV1(pydantic.BaseModel):
+class MissionStatusV1(common.JsonModel):
     """Specifies the progress made on the mission so far."""
     state: MissionStateV1 = pydantic.Field(
         MissionStateV1.PENDING, description="The completion status of the mission.")
@@ -335,15 +361,31 @@ class MissionObjectV1(MissionSpecV1, object.ApiObject):
     """Specifies a mission, which is a list of orders, to be completed by a specific robot."""
     status: MissionStatusV1
 
+    ALIAS = "mission"
+    _QUERY_MAP = {
+        "state": "status->>'state' = %s",
+        "started_after": "(status->>'start_timestamp') >= %s",
+        "started_before": "(status->>'start_timestamp') <= %s",
+        "robot": "spec->>'robot' = %s",
+        "most_recent": " ORDER BY (status->>'start_timestamp') DESC LIMIT %s"
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for node in ["root"] + [node.name for node in self.mission_tree if node.name is not None]:
-            if node not in self.status.node_status:
-                self.status.node_status[str(node)] = MissionNodeStatusV1()
+        self._init_node_status()
 
     @classmethod
-    def get_alias(cls) -> str:
-        return "mission"
+    def from_trusted(cls, **kwargs):
+        obj = super().from_trusted(**kwargs)
+        obj._init_node_status()
+        return obj
+
+    def _init_node_status(self):
+        node_status = self.status.node_status
+        names = itertools.chain(
+            ["root"], (node.name for node in self.mission_tree if node.name is not None))
+        node_status.update({str(name): MissionNodeStatusV1()
+                            for name in names if name not in node_status})
 
     @classmethod
     def get_spec_class(cls) -> Any:
@@ -396,7 +438,7 @@ class MissionObjectV1(MissionSpecV1, object.ApiObject):
         if self.status.state.done:
             raise common.ICSUsageError(
                 f"Mission {self.name} is finished with status {self.status.state}.")
-        current_node_names = [n.name for n in self.mission_tree]
+        current_node_names = {n.name for n in self.mission_tree}
         for node_name, _ in update_nodes.items():
             if node_name not in current_node_names:
                 raise common.ICSUsageError(
@@ -409,13 +451,3 @@ class MissionObjectV1(MissionSpecV1, object.ApiObject):
         # Update when the nodes exist in the mission and the mission is in PENDING or RUNNING state
         self.update_nodes = update_nodes
         return update_nodes
-
-    @staticmethod
-    def get_query_map() -> Dict:
-        return {
-            "state": "status->>'state' = '{}'",
-            "started_after": "(status->>'start_timestamp') >= '{}'",
-            "started_before": "(status->>'start_timestamp') <= '{}'",
-            "robot": "spec->>'robot' = '{}'",
-            "most_recent": " ORDER BY (status->>'start_timestamp') DESC LIMIT {}"
-        }
@@ -20,9 +20,9 @@ import abc
 import base64
 import enum
 import uuid
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Type
 
-import pydantic
+from cloud_common.objects import common
 
 # The number of characters to include in the short object ID
 SHORT_ID_LENGTH = 8
@@ -42,9 +42,14 @@ class ApiObjectMethod(NamedTuple):
     returns: Optional[Type] = None
 
 
-class ApiObject(pydantic.BaseModel, metaclass=abc.ABCMeta):
+class ApiObject(common.JsonModel, metaclass=abc.ABCMeta):
     """Represents an api object with a specification and a state"""
 
+    # The name used to refer to this type of object in the REST API
+    ALIAS: ClassVar[str]
+    # SQL conditions for each supported query parameter, with a %s placeholder for its value
+    _QUERY_MAP: ClassVar[Dict[str, str]] = {}
+
     # Every API object has a unique name
     name: str
     status: Any = None
@@ -55,14 +60,21 @@ class ApiObject(pydantic.BaseModel, metaclass=abc.ABCMeta):
             kwargs["name"] = self.get_uuid()
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_trusted(cls, **kwargs):
+        """Creates an object from field values that have already been validated, such as the
+        fields of another validated model. Validation is skipped entirely."""
+        if kwargs.get("name") is None:
+            kwargs["name"] = cls.get_uuid()
+        return cls.construct(**kwargs)
+
     @property
     def spec(self) -> Any:
         return self.get_spec_class()(**self.dict())
 
     @classmethod
-    @abc.abstractmethod
     def get_alias(cls) -> str:
-        pass
+        return cls.ALIAS
 
     @classmethod
     @abc.abstractmethod
@@ -79,9 +91,9 @@ class ApiObject(pydantic.BaseModel, metaclass=abc.ABCMeta):
     def get_query_params(cls) -> Any:
         pass
 
-    @staticmethod
-    def get_query_map() -> Dict:
-        return {}
+    @classmethod
+    def get_query_map(cls) -> Dict:
+        return cls._QUERY_MAP
 
     @classmethod
     def get_methods(cls) -> List[ApiObjectMethod]:
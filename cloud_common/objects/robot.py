@@ -16,6 +16,7 @@ limitations under the License.
 
 SPDX-License-Identifier: Apache-2.0
 """
+import copy
 import datetime
 import enum
 from typing import Any, Dict, List, Optional
@@ -39,16 +40,23 @@ class RobotStateV1(enum.Enum):
 
     @property
     def running(self):
-        return self in (RobotStateV1.ON_TASK, RobotStateV1.MAP_DEPLOYMENT, RobotStateV1.CHARGING)
+        return self in _ROBOT_RUNNING_STATES
 
     @property
     def can_switch_teleop(self):
-        return self in (RobotStateV1.IDLE, RobotStateV1.ON_TASK,
-                        RobotStateV1.MAP_DEPLOYMENT, RobotStateV1.TELEOP)
+        return self in _ROBOT_CAN_SWITCH_TELEOP_STATES
 
     @property
     def can_deploy_map(self):
-        return self in (RobotStateV1.IDLE, RobotStateV1.CHARGING)
+        return self in _ROBOT_CAN_DEPLOY_MAP_STATES
+
+
+# The robot states that each of the RobotStateV1 predicates accept
+_ROBOT_RUNNING_STATES = frozenset(
+    (RobotStateV1.ON_TASK, RobotStateV1.MAP_DEPLOYMENT, RobotStateV1.CHARGING))
+_ROBOT_CAN_SWITCH_TELEOP_STATES = frozenset(
+    (RobotStateV1.IDLE, RobotStateV1.ON_TASK, RobotStateV1.MAP_DEPLOYMENT, RobotStateV1.TELEOP))
+_ROBOT_CAN_DEPLOY_MAP_STATES = frozenset((RobotStateV1.IDLE, RobotStateV1.CHARGING))
 
 
 class RobotTeleopActionV1(enum.Enum):
@@ -83,7 +91,7 @@ class RobotBatterySpecV1(pydantic.BaseModel):
     recommended_maximum: Optional[float] = None
 
 
-class RobotStatusV1(pydantic.BaseModel):
+class RobotStatusV1(common.JsonModel):
     """Represents the status of the robot."""
     pose: common.Pose2D = common.Pose2D()
     software_version: RobotSoftwareVersionV1 = RobotSoftwareVersionV1()
@@ -95,10 +103,11 @@ class RobotStatusV1(pydantic.BaseModel):
     info_messages: Optional[Dict] = pydantic.Field(
         None, description="Data collected from the mission client.")
     errors: Dict = pydantic.Field(
-        {}, description="Key value pairs to describe if something is wrong with the robot.")
+        default_factory=dict,
+        description="Key value pairs to describe if something is wrong with the robot.")
 
 
-class RobotSpecV1(pydantic.BaseModel):
+class RobotSpecV1(common.JsonModel):
     """Specifies constant properties about the robot, such as its name."""
     labels: List[str] = pydantic.Field(
         [], description="A list of labels to assign to the robot, used to identify certain groups \
@@ -113,6 +122,10 @@ class RobotSpecV1(pydantic.BaseModel):
     )
 
 
+# The default robot spec only depends on the field defaults, so it is only built once
+_DEFAULT_ROBOT_SPEC = RobotSpecV1().dict()
+
+
 class RobotQueryParamsV1(pydantic.BaseModel):
     """Specifies the supported query parameters allowed for robots"""
     min_battery: Optional[float]
@@ -127,9 +140,15 @@ class RobotObjectV1(RobotSpecV1, object.ApiObject):
     """Represents a robot."""
     status: RobotStatusV1
 
-    @classmethod
-    def get_alias(cls) -> str:
-        return "robot"
+    ALIAS = "robot"
+    _QUERY_MAP = {
+        "min_battery": "(status->'battery_level')::float >= %s",
+        "max_battery": "(status->'battery_level')::float <= %s",
+        "names": "name = ANY(%s)",
+        "state": "status->>'state' = %s",
+        "online": "status->>'online' = %s",
+        "robot_type": "(status->'factsheet'->>'agv_class')::text = %s"
+    }
 
     @classmethod
     def get_spec_class(cls) -> Any:
@@ -141,23 +160,12 @@ class RobotObjectV1(RobotSpecV1, object.ApiObject):
 
     @classmethod
     def default_spec(cls) -> Dict:
-        return RobotSpecV1().dict()  # type: ignore
+        return copy.deepcopy(_DEFAULT_ROBOT_SPEC)
 
     @classmethod
     def get_query_params(cls) -> Any:
         return RobotQueryParamsV1
 
-    @staticmethod
-    def get_query_map() -> Dict:
-        return {
-            "min_battery": "(status->'battery_level')::float >= {}",
-            "max_battery": "(status->'battery_level')::float <= {}",
-            "names": "name in {}",
-            "state": "status->>'state' = '{}'",
-            "online": "status->>'online' = '{}'",
-            "robot_type": "(status->'factsheet'->>'agv_class')::text = '{}'"
-        }
-
     @classmethod
     def get_methods(cls) -> List[object.ApiObjectMethod]:
         return [
@@ -16,29 +16,30 @@ limitations under the License.
 
 SPDX-License-Identifier: Apache-2.0
 """
+import logging
 import py_trees
-from typing import Any
+from typing import Any, Callable, Dict, List, Tuple
 import cloud_common.objects.mission as mission_object
 
+logger = logging.getLogger("Isaac Mission Dispatch")
+
+_TREE2MISSION_STATE = {
+    py_trees.common.Status.SUCCESS: mission_object.MissionStateV1.COMPLETED,
+    py_trees.common.Status.FAILURE: mission_object.MissionStateV1.FAILED,
+    py_trees.common.Status.RUNNING: mission_object.MissionStateV1.RUNNING,
+}
+
+_MISSION2TREE_STATE = {
+    mission_object.MissionStateV1.COMPLETED: py_trees.common.Status.SUCCESS,
+    mission_object.MissionStateV1.RUNNING: py_trees.common.Status.RUNNING,
+    mission_object.MissionStateV1.PENDING: py_trees.common.Status.INVALID,
+}
+
 def tree2mission_state(type: py_trees.common.Status) -> mission_object.MissionStateV1:
-    if type == py_trees.common.Status.SUCCESS:
-        return mission_object.MissionStateV1.COMPLETED
-    elif type == py_trees.common.Status.FAILURE:
-        return mission_object.MissionStateV1.FAILED
-    elif type == py_trees.common.Status.RUNNING:
-        return mission_object.MissionStateV1.RUNNING
-    else:
-        return mission_object.MissionStateV1.PENDING
+    return _TREE2MISSION_STATE.get(type, mission_object.MissionStateV1.PENDING)
 
 def mission2tree_state(type: mission_object.MissionStateV1) -> py_trees.common.Status:
-    if type == mission_object.MissionStateV1.COMPLETED:
-        return py_trees.common.Status.SUCCESS
-    elif type == mission_object.MissionStateV1.RUNNING:
-        return py_trees.common.Status.RUNNING
-    elif type == mission_object.MissionStateV1.PENDING:
-        return py_trees.common.Status.INVALID
-    else:
-        return py_trees.common.Status.FAILURE
+    return _MISSION2TREE_STATE.get(type, py_trees.common.Status.FAILURE)
 
 
 class ConstantBehaviorNode(py_trees.behaviour.Behaviour):
@@ -47,8 +48,8 @@ class ConstantBehaviorNode(py_trees.behaviour.Behaviour):
     """
 
     def __init__(self, name: str, idx: int, const_status=py_trees.common.Status.SUCCESS):
-        print(
-            f"Create a constant node for mission node {idx} with status {const_status}", flush=True)
+        logger.debug("Create a constant node for mission node %d with status %s",
+                     idx, const_status)
         self.idx = idx
         self.name = name
         self.const_status = const_status
@@ -74,12 +75,14 @@ class MissionLeafNode(py_trees.behaviour.Behaviour):
     """
     Route/action/notify behavior tree node
     """
-    def __init__(self, mission: mission_object.MissionObjectV1, idx: int,
+    def __init__(self, mission: mission_object.MissionObjectV1, name: str, idx: int,
                  status=py_trees.common.Status.INVALID):
         self.mission = mission
         self.idx = idx
-        self.name = str(self.mission.mission_tree[idx].name)
+        self.name = name
         self.status = status
+        # The mission status entries are only updated in place, so the entry can be kept
+        self._node_status = self.mission.status.node_status[self.name]
         super(MissionLeafNode, self).__init__(self.name) # pylint: disable=super-with-arguments
 
     @property
@@ -97,11 +100,10 @@ class MissionLeafNode(py_trees.behaviour.Behaviour):
     def update(self) -> py_trees.common.Status:
         # Update result based on order information feedback from server
         # Count PENDING orders as RUNNING since the robot might not have acknowledged the order yet
-        if self.mission.status.node_status[self.name].state == \
-            mission_object.MissionStateV1.PENDING:
+        state = self._node_status.state
+        if state is mission_object.MissionStateV1.PENDING:
             return py_trees.common.Status.RUNNING
-        else:
-            return mission2tree_state(self.mission.status.node_status[self.name].state)
+        return _MISSION2TREE_STATE.get(state, py_trees.common.Status.FAILURE)
 
 
 class SequenceBehaviorNode(py_trees.composites.Sequence):
@@ -144,6 +146,27 @@ class SelectorBehaviorNode(py_trees.composites.Selector):
         return True
 
 
+# Creates the behavior tree node for each type of mission node from the mission, the mission node,
+# its name, its index in the mission tree and its initial status
+_NODE_FACTORIES: Dict[mission_object.MissionNodeType, Callable[..., Any]] = {
+    mission_object.MissionNodeType.SELECTOR: lambda mission, node, name, idx, status:
+        SelectorBehaviorNode(name, idx, status),
+    mission_object.MissionNodeType.SEQUENCE: lambda mission, node, name, idx, status:
+        SequenceBehaviorNode(name, idx, status),
+    mission_object.MissionNodeType.ROUTE: lambda mission, node, name, idx, status:
+        MissionLeafNode(mission, name, idx, status),
+    mission_object.MissionNodeType.ACTION: lambda mission, node, name, idx, status:
+        MissionLeafNode(mission, name, idx, status),
+    mission_object.MissionNodeType.NOTIFY: lambda mission, node, name, idx, status:
+        MissionLeafNode(mission, name, idx, status),
+    mission_object.MissionNodeType.MOVE: lambda mission, node, name, idx, status:
+        MissionLeafNode(mission, name, idx, status),
+    mission_object.MissionNodeType.CONSTANT: lambda mission, node, name, idx, status:
+        ConstantBehaviorNode(name, idx, py_trees.common.Status.SUCCESS
+                             if node.constant.success else py_trees.common.Status.FAILURE),
+}
+
+
 class MissionBehaviorTree():
     """Mission behavior Tree
     """
@@ -152,11 +175,16 @@ class MissionBehaviorTree():
         self.root = py_trees.composites.Sequence(name="root")
         self.mission = mission
         self.failure_reason = ""
+        # Index of the tree nodes by name, used to find the parent of each new node
+        self._by_name: Dict[str, Any] = {"root": self.root}
+        # The nodes whose state is reported back to the mission, paired with their status entry
+        self._order_nodes: List[Tuple[Any, mission_object.MissionNodeStatusV1]] = []
+        # The last running node of the tree, which only changes when the tree is ticked
+        self._current_node: Any = None
 
     @property
     def current_node(self) -> Any:
-        # Recursive function to extract the last running node of the tree
-        return self.root.tip()
+        return self._current_node
 
     @property
     def status(self) -> py_trees.common.Status:
@@ -164,53 +192,49 @@ class MissionBehaviorTree():
 
     def create_behavior_tree(self):
         for i, mission_node in enumerate(self.mission.mission_tree):
+            name = str(mission_node.name)
+            node_status = self.mission.status.node_status[name]
+            status = mission2tree_state(node_status.state)
             # Get parent node
-            status = mission2tree_state(
-                self.mission.status.node_status[str(mission_node.name)].state)
-            parent = None
-            for node in self.root.iterate():
-                if node.name == mission_node.parent:
-                    parent = node
+            parent = self._by_name.get(mission_node.parent)
             if parent is None:
-                self.root.status = py_trees.common.Status.FAILURE
-                self.failure_reason = f"Given parent {mission_node.parent} does not exist"
-                return False
-
-            # Check if this is a control node: selector or sequence
-            if mission_node.type == mission_object.MissionNodeType.SELECTOR:
-                parent.add_child(SelectorBehaviorNode(str(mission_node.name), i, status))
-            elif mission_node.type == mission_object.MissionNodeType.SEQUENCE:
-                parent.add_child(SequenceBehaviorNode(str(mission_node.name), i, status))
-            # Check if this is a leaf node: route, action, or notify
-            elif mission_node.type in (mission_object.MissionNodeType.ROUTE,
-                                       mission_object.MissionNodeType.ACTION,
-                                       mission_object.MissionNodeType.NOTIFY,
-                                       mission_object.MissionNodeType.MOVE):
-                leaf_node = MissionLeafNode(self.mission, i, status)
-                parent.add_child(leaf_node)
-            elif mission_node.type == mission_object.MissionNodeType.CONSTANT:
-                if mission_node.constant is not None:
-                    if mission_node.constant.success:
-                        status = py_trees.common.Status.SUCCESS
-                    else:
-                        status = py_trees.common.Status.FAILURE
-                    parent.add_child(ConstantBehaviorNode(str(mission_node.name), i, status))
-            # Not supported mission node type
-            else:
+                return self._fail(f"Given parent {mission_node.parent} does not exist")
+            # Leaf nodes cannot have children
+            if not isinstance(parent, py_trees.composites.Composite):
+                return self._fail(f"Given parent {mission_node.parent} is not a selector or "
+                                  "sequence")
+
+            factory = _NODE_FACTORIES.get(mission_node.type)
+            if factory is None:
+                # Not supported mission node type
                 self.info("Invalid mission node type")
+                continue
+            child = factory(self.mission, mission_node, name, i, status)
+            parent.add_child(child)
+            self._by_name[name] = child
+            if child.is_order:
+                self._order_nodes.append((child, node_status))
         return True
 
+    def _fail(self, failure_reason: str) -> bool:
+        self.root.status = py_trees.common.Status.FAILURE
+        self.failure_reason = failure_reason
+        self._current_node = self.root.tip()
+        return False
+
     def update(self):
         self.root.tick_once()
+        # Recursively extract the last running node of the tree
+        self._current_node = self.root.tip()
         self.post_tick()
 
     def post_tick(self):
         # Update all the non-pending control node
-        for node in self.root.iterate():
-            if node.name != "root" and node.is_order:
-                self.mission.status.node_status[node.name].state = \
-                    tree2mission_state(node.status)
+        for node, node_status in self._order_nodes:
+            state = _TREE2MISSION_STATE.get(node.status, mission_object.MissionStateV1.PENDING)
+            if node_status.state is not state:
+                node_status.state = state
 
     def info(self, message: str):
-        print(f"[Isaac Mission Dispatch (Behavior Tree)] | : "
-              f"[{self.mission.name}] {message}", flush=True)
+        logger.info("[Isaac Mission Dispatch (Behavior Tree)] | : [%s] %s",
+                    self.mission.name, message)
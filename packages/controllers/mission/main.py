@@ -24,8 +24,10 @@ from packages.controllers.mission import server as mission_server
 
 LOGGING_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 
+logger = logging.getLogger("Isaac Mission Dispatch")
 
-if __name__ == "__main__":
+
+def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--mqtt_host", default="localhost",
                         help="The hostname of the mqtt server to connect to")
@@ -54,9 +56,12 @@ if __name__ == "__main__":
                         help="Disable factsheet pulling")
 
     args = parser.parse_known_args()[0]
-    logger = logging.getLogger("Isaac Mission Dispatch")
-    logger.setLevel(args.log_level)
+    logger.setLevel(logging.getLevelName(args.log_level))
     logger.addHandler(logging.StreamHandler(sys.stderr))
     del args.log_level
     server = mission_server.RobotServer(**vars(args))
     server.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,16 +21,17 @@ SPDX-License-Identifier: Apache-2.0
 # specified here https://github.com/VDA5050/VDA5050/blob/main/VDA5050_EN.md
 import asyncio
 import datetime
-import json
+import functools
 import logging
-import re
+import queue as thread_queue
 import requests  # type: ignore
 import socket
 import time
 import threading
-from typing import Any, Dict, List, Optional, Union, cast
-from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from collections import deque
 
+import orjson
 import paho.mqtt.client as mqtt_client
 import pydantic
 
@@ -58,6 +59,31 @@ TelemetrySender = getattr(module, "TelemetrySender")
 MQTT_RECONNECT_PERIOD = 0.5
 # How long to wait in seconds before trying to reconnect to the mission database
 DATABASE_RECONNECT_PERIOD = 0.5
+# How many messages can be waiting for a robot before warning that it is falling behind
+ROBOT_MESSAGE_BACKLOG_WARNING = 256
+# How long in seconds the result of a mission control health check is reused for
+MISSION_CTRL_HEALTH_PERIOD = 2.0
+# The most status updates to collect and coalesce before writing them to the database
+STATUS_UPDATE_BATCH_SIZE = 32
+# How many times to retry a notify request that failed with a retryable status code
+NOTIFY_MAX_RETRIES = 3
+# The first and the longest delay in seconds between retries of a notify request
+NOTIFY_BACKOFF_BASE = 0.5
+NOTIFY_BACKOFF_CAP = 4.0
+
+# The action types of instant actions, which robots append to the end of their action states
+_INSTANT_ACTION_TYPES = frozenset(types.VDA5050InstantActionType.values() +
+                                  types.NVInstantActionType.values())
+# The error reference keys whose values refer to a mission node
+_NODE_REFERENCE_KEYS = frozenset(("node_id", "nodeId", "action_id", "actionId"))
+# For each mission node type sent to robots as an order, the mission node field with the order
+# details and the factory that builds the order from them
+_ORDER_FACTORIES: Dict[mission_object.MissionNodeType,
+                       Tuple[str, Callable[..., types.VDA5050Order]]] = {
+    mission_object.MissionNodeType.ROUTE: ("route", types.VDA5050Order.from_route),
+    mission_object.MissionNodeType.MOVE: ("move", types.VDA5050Order.from_move),
+    mission_object.MissionNodeType.ACTION: ("action", types.VDA5050Order.from_action),
+}
 
 RobotMessage = Union[api_objects.RobotObjectV1,
                      api_objects.MissionObjectV1,
@@ -65,34 +91,58 @@ RobotMessage = Union[api_objects.RobotObjectV1,
                      types.VDA5050Factsheet]
 
 
-class ClientMessage(pydantic.BaseModel):
-    name: str
-    # TODO: perhaps do OOP to handle typing of payload too;
-    # currently default is any
-    payload: Any
+# A message received from a robot over MQTT, paired with the name of the robot that sent it
+ClientMessage = Tuple[str, Union[types.VDA5050State, types.VDA5050Factsheet]]
 
 
-class ClientStatusMessage(ClientMessage):
-    name: str
-    payload: types.VDA5050State
+def _mission_status_snapshot(status: mission_object.MissionStatusV1) -> Tuple:
+    """Captures the values of a mission status, so it can be compared with the status later
+    without deep copying it"""
+    return (status.state, status.current_node, status.start_timestamp, status.end_timestamp,
+            status.failure_reason, status.failure_category,
+            tuple((name, node.state, node.error_msg) for name, node in status.node_status.items()),
+            tuple(status.task_status.items()))
 
 
-class ClientFactsheetMessage(ClientMessage):
-    name: str
-    payload: types.VDA5050Factsheet
+def _robot_status_snapshot(status: robot_object.RobotStatusV1) -> Tuple:
+    """Captures the values of a robot status, so it can be compared with the status later
+    without deep copying it"""
+    return (status.pose.x, status.pose.y, status.pose.theta, status.pose.map_id,
+            status.software_version.os, status.software_version.app,
+            status.hardware_version.manufacturer, status.hardware_version.serial_number,
+            status.factsheet.agv_class, status.factsheet.speed_max,
+            status.online, status.battery_level, status.state,
+            status.info_messages, dict(status.errors))
 
 
 class Robot:
     """Manages the mission state of a particular robot"""
+    # A robot object exists for every robot known to the server, so avoid a __dict__ per robot
+    __slots__ = ("_logger", "_loop", "_name", "_mqtt_prefix", "_order_topic",
+                 "_instant_actions_topic", "_messages", "_database", "_robot_object",
+                 "_robot_status_written", "_detection_results_object", "_missions",
+                 "_current_mission", "_current_instant_actions", "_mqtt_client",
+                 "_robot_online_task", "_mission_control_task", "_robot_last_seen",
+                 "_robot_seen", "_robot_server", "_alive", "_header_id",
+                 "_current_behavior_tree", "_updating_mission_from_api", "_message_handlers",
+                 "_telemetry", "_cur_robot_state_timestamp", "_charging_mission_received",
+                 "last_node_seq_id")
 
     def __init__(self, name: str, db: db_client.DatabaseClient, client: mqtt_client.Client,
                  prefix: str, server: "RobotServer"):
         self._logger = logging.getLogger("Isaac Mission Dispatch")
+        # Robots are always created from coroutines running on the robot server's event loop
+        self._loop = asyncio.get_running_loop()
         self._name = name
         self._mqtt_prefix = prefix
+        # The topics this robot's orders and instant actions are published to
+        self._order_topic = f"{prefix}/{name}/order"
+        self._instant_actions_topic = f"{prefix}/{name}/instantActions"
         self._messages: asyncio.Queue[RobotMessage] = asyncio.Queue()
         self._database = db
         self._robot_object: Optional[api_objects.RobotObjectV1] = None
+        # The robot status as of the last time it was written to the database
+        self._robot_status_written: Optional[Tuple] = None
         self._detection_results_object: Optional[api_objects.DetectionResultsObjectV1] = None
         # Try to get existing detected objects.
         try:
@@ -103,28 +153,38 @@ class Robot:
             )
         except api_objects.common.ICSError:
             pass
-        self._missions: OrderedDict[str,
-                                    api_objects.MissionObjectV1] = OrderedDict()
+        # Missions are run in the order they are received
+        self._missions: Dict[str, api_objects.MissionObjectV1] = {}
         self._current_mission: Optional[api_objects.MissionObjectV1] = None
-        self._current_instant_actions: OrderedDict[str,
-                                                   types.VDA5050Action] = OrderedDict()
+        self._current_instant_actions: Dict[str, types.VDA5050Action] = {}
         self._mqtt_client = client
         self._robot_online_task: Optional[asyncio.Task[Any]] = None
+        self._mission_control_task: Optional[asyncio.Task[Any]] = None
+        # The event loop time of the last message from the robot
+        self._robot_last_seen = 0.0
+        # Set whenever a message is received from the robot
+        self._robot_seen = asyncio.Event()
         self._robot_server = server
         self._alive = True
         self._header_id = 0
         self._current_behavior_tree: Optional[behavior_tree.MissionBehaviorTree] = None
         self._updating_mission_from_api: bool = False
+        # The handler for each type of message the robot receives
+        self._message_handlers: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            api_objects.RobotObjectV1: self._on_robot_change,
+            api_objects.MissionObjectV1: self._on_mission_change,
+            types.VDA5050State: self._on_client_message,
+            types.VDA5050Factsheet: self._on_client_factsheet,
+        }
         self._charging_mission_received: bool = False
         self.last_node_seq_id: int = -1
 
         if self._robot_server.push_telemetry:
             self._telemetry = metrics.Telemetry()
-            self._telemetry_client = TelemetrySender(
-                self._robot_server.telemetry_env)
-        # To calculate the durition of a robot state
-        self._cur_robot_state_timestamp = datetime.datetime.now()
-        asyncio.get_event_loop().create_task(self.run())
+        # To calculate the durition of a robot state. Uses the event loop's monotonic clock, so
+        # durations are not affected by changes to the wall clock
+        self._cur_robot_state_timestamp = self._loop.time()
+        self._loop.create_task(self.run())
 
     async def _try_start_mission(self):
         # Schedule a new mission if we aren't doing anything and there is one in the queue
@@ -151,18 +211,18 @@ class Robot:
             return
 
         self.update_mission_from_behavior_tree()
-        asyncio.get_event_loop().create_task(self._wait_mission_timeout(
+        self._loop.create_task(self._wait_mission_timeout(
             self._current_mission.timeout.total_seconds(),
             self._current_mission.name))
         await self._send_order()
 
     async def _send_instant_action(self, instant_action: types.VDA5050Action):
-        instant_actions = types.VDA5050InstantActions(
+        # Built from an already validated action, so skip validating it again
+        instant_actions = types.VDA5050InstantActions.construct(
             headerId=self._header_id,
             timestamp=datetime.datetime.now().isoformat(),
             instantActions=[instant_action])
-        self._mqtt_client.publish(f"{self._mqtt_prefix}/{self._name}/instantActions",
-                                  instant_actions.json())
+        self._mqtt_client.publish(self._instant_actions_topic, instant_actions.json_bytes())
         self._header_id += 1
 
     async def _send_order(self):
@@ -180,40 +240,29 @@ class Robot:
                       behavior_tree.MissionLeafNode):
             idx = self._current_behavior_tree.current_node.idx
             mission_node = self._current_mission.mission_tree[idx]
+            node_type = mission_node.type
 
             # Notify node does not send an order to robot, everything is handled in Dispatch
-            if mission_node.type == mission_object.MissionNodeType.NOTIFY and \
+            if node_type is mission_object.MissionNodeType.NOTIFY and \
                     mission_node.notify is not None:
-                self._process_notify_node(mission_node)
+                await self._process_notify_node(mission_node)
                 return
 
-            if mission_node.type == mission_object.MissionNodeType.ROUTE and \
-                    mission_node.route is not None:
-                order = types.VDA5050Order.from_route(mission_node.route, self._robot_object,
-                                                      self._current_mission.name, idx)
-                self.mission_info("Sending mission route node "
-                                  f"{mission_node.name}")
-
-            elif mission_node.type == mission_object.MissionNodeType.MOVE and \
-                    mission_node.move is not None:
-                order = types.VDA5050Order.from_move(mission_node.move, self._robot_object,
-                                                     self._current_mission.name, idx)
-                self.mission_info("Sending mission move node "
-                                  f"{mission_node.name}")
-
-            elif mission_node.type == mission_object.MissionNodeType.ACTION and \
-                    mission_node.action is not None:
-                order = types.VDA5050Order.from_action(mission_node.action, self._robot_object,
-                                                       self._current_mission.name, idx)
-                self.mission_info("Sending mission action node "
-                                  f"{mission_node.name}")
+            order_factory = _ORDER_FACTORIES.get(node_type)
+            if order_factory is None:
+                return
+            field, factory = order_factory
+            details = getattr(mission_node, field)
+            if details is None:
+                return
+            order = factory(details, self._robot_object, self._current_mission.name, idx)
+            self.mission_info("Sending mission %s node %s", field, mission_node.name)
 
             order.headerId = self._header_id
             self._header_id += 1
             order.timestamp = datetime.datetime.now().isoformat()
 
-            self._mqtt_client.publish(
-                f"{self._mqtt_prefix}/{self._name}/order", order.json())
+            self._mqtt_client.publish(self._order_topic, order.json_bytes())
             self.set_mission_node_state(f"{mission_node.name}",
                                         mission_object.MissionStateV1.RUNNING)
 
@@ -222,43 +271,43 @@ class Robot:
         cancel_current_node = False
         # From POST /mission/{name}/cancel endpoint
         if mission.needs_canceled != message.needs_canceled:
-            self.info(
-                f"Cancel a {mission.status.state} mission [{message.name}]")
+            self.info("Cancel a %s mission [%s]", mission.status.state, message.name)
             mission.needs_canceled = message.needs_canceled
             return cancel_current_node
 
         # From DELETE /mission/{name} endpoint
         if mission.lifecycle != message.lifecycle:
-            self.info(
-                f"{mission.status.state} mission lifecycle is changed to {message.lifecycle}")
+            self.info("%s mission lifecycle is changed to %s", mission.status.state,
+                      message.lifecycle)
             mission.lifecycle = message.lifecycle
             return cancel_current_node
 
         # From POST /mission/{name}/update endpoint
         if message.update_nodes:
-            self.info(
-                f"Update mission nodes: {list(message.update_nodes.keys())}")
+            if self._logger.isEnabledFor(logging.INFO):
+                self.info("Update mission nodes: %s", list(message.update_nodes.keys()))
+            nodes_by_name = {n.name: n for n in mission.mission_tree}
             for node_name, route in message.update_nodes.items():
-                for n in mission.mission_tree:
-                    if n.name == node_name:
-                        n.route = route
-                        if mission.status.node_status[node_name].state is \
-                                mission_object.MissionStateV1.RUNNING:
-                            # Cancel current node
-                            cancel_current_node = True
-                        break
+                node = nodes_by_name.get(node_name)
+                if node is None:
+                    continue
+                node.route = route
+                if mission.status.node_status[node_name].state is \
+                        mission_object.MissionStateV1.RUNNING:
+                    # Cancel current node
+                    cancel_current_node = True
         return cancel_current_node
 
     async def _on_mission_change(self, message: api_objects.MissionObjectV1):
         # If this is a new mission, add it to the queue
         if message.name not in self._missions:
-            self.info(f"Received a new mission [{message.name}]")
+            self.info("Received a new mission [%s]", message.name)
             self._missions[message.name] = message
             if self._current_mission is None:
                 await self._try_start_mission()
         else:  # If we've seen this mission, update it
             if self._current_mission is not None and self._current_mission.name == message.name:
-                self.info(f"Update a RUNNING mission [{message.name}]")
+                self.info("Update a RUNNING mission [%s]", message.name)
                 cancel_node_from_api = self._update_mission_from_api(
                     self._current_mission, message)
                 # Delete/Cancel a running mission
@@ -272,12 +321,12 @@ class Robot:
                     instant_action = types.VDA5050Action(
                         actionType=types.VDA5050InstantActionType.CANCEL_ORDER,
                         actionId=action_id)
-                    self.mission_info(f"Send cancel order action {action_id}")
+                    self.mission_info("Send cancel order action %s", action_id)
                     await self._send_instant_action(instant_action)
                     self._current_instant_actions[action_id] = instant_action
                 return
 
-            self.info(f"Update a PENDING mission [{message.name}]")
+            self.info("Update a PENDING mission [%s]", message.name)
             self._update_mission_from_api(
                 self._missions[message.name], message)
             # Delete a queued mission
@@ -286,7 +335,7 @@ class Robot:
             # Cancel a queued mission
             elif message.needs_canceled:
                 self._missions[message.name].status.state = mission_object.MissionStateV1.CANCELED
-                self._database.update_status(self._missions[message.name])
+                self._robot_server.update_status(self._missions[message.name])
                 del self._missions[message.name]
 
     async def _on_robot_change(self, message: api_objects.RobotObjectV1):
@@ -296,16 +345,16 @@ class Robot:
             self._robot_object = message
 
             self._header_id = 0
+            self._robot_last_seen = self._loop.time()
             self._robot_online_task = \
-                asyncio.get_event_loop().create_task(self._check_robot_online())
+                self._loop.create_task(self._check_robot_online())
 
             if not self._robot_server.disable_request_factsheet:
                 action_id = f"instantaction-n{self._header_id}"
                 factsheet_action_type = types.VDA5050InstantActionType.FACTSHEET_REQUEST
                 instant_action = types.VDA5050Action(
                     actionType=factsheet_action_type, actionId=action_id)
-                self.info(
-                    f"FACTSHEET INFO: Sending {factsheet_action_type.value} action.")
+                self.info("FACTSHEET INFO: Sending %s action.", factsheet_action_type.value)
                 await self._send_instant_action(instant_action)
                 self._current_instant_actions[action_id] = instant_action
 
@@ -325,72 +374,86 @@ class Robot:
 
             # Teleop update
             if (message.switch_teleop and
-                    self._robot_object.status.state != robot_object.RobotStateV1.TELEOP) or \
+                    self._robot_object.status.state is not robot_object.RobotStateV1.TELEOP) or \
                     (not message.switch_teleop and
-                     self._robot_object.status.state == robot_object.RobotStateV1.TELEOP):
+                     self._robot_object.status.state is robot_object.RobotStateV1.TELEOP):
                 action_id = f"instantaction-n{self._header_id}"
                 action_type = types.NVInstantActionType.START_TELEOP \
                     if message.switch_teleop else types.NVInstantActionType.STOP_TELEOP
                 instant_action = types.VDA5050Action(
                     actionType=action_type, actionId=action_id)
-                self.mission_info(f"Sending {action_type.value} action.")
+                self.mission_info("Sending %s action.", action_type.value)
                 await self._send_instant_action(instant_action)
                 self._current_instant_actions[action_id] = instant_action
 
             # Robot object update
             self._robot_object = message
+            self._robot_status_written = None
 
     async def _check_robot_online(self):
-        if self._robot_object is None:
-            return
+        # A single task for the lifetime of the robot. Messages from the robot only move
+        # self._robot_last_seen forward, and the robot is marked offline once no message has been
+        # received for the heartbeat timeout
         try:
-            await asyncio.sleep(self._robot_object.heartbeat_timeout.total_seconds())
-            self.info("Robot Offline")
-            if not self._robot_object.status.online:
-                return
-            self._robot_object.status.online = False
-            if self._robot_object.lifecycle is not api_objects.object.ObjectLifecycleV1.DELETED:
-                self._database.update_status(self._robot_object)
+            while self._alive and self._robot_object is not None:
+                timeout = self._robot_object.heartbeat_timeout.total_seconds()
+                remaining = self._robot_last_seen + timeout - self._loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                if self._robot_object.status.online:
+                    self.info("Robot Offline")
+                    self._robot_object.status.online = False
+                    if self._robot_object.lifecycle is not \
+                            api_objects.object.ObjectLifecycleV1.DELETED:
+                        self._update_robot_status()
+                # Wait for the next message instead of polling, which would spin if the heartbeat
+                # timeout is not positive
+                self._robot_seen.clear()
+                await self._robot_seen.wait()
         except asyncio.CancelledError:
             self.debug("Cancelled robot online check.")
 
     async def handle_instant_action(self, message: types.VDA5050State):
         # Handle instant actions
-        updated_instant_action_ids = []
+        updated_instant_action_ids = set()
         finished_instant_actions = []
-        for action_state in message.actionStates[::-1]:
+        # The number of sent instant actions not found in the feedback yet
+        remaining = len(self._current_instant_actions)
+        for action_state in reversed(message.actionStates):
             # Iterate through all the appended instant actions
-            if action_state.actionType not in (types.VDA5050InstantActionType.values() +
-                                               types.NVInstantActionType.values()):
+            if remaining == 0 or action_state.actionType not in _INSTANT_ACTION_TYPES:
                 break
-            if action_state.actionId in self._current_instant_actions.keys():
+            if action_state.actionId in self._current_instant_actions:
+                # A robot can report the same instant action more than once, only count it once
+                if action_state.actionId not in updated_instant_action_ids:
+                    remaining -= 1
                 if action_state.actionStatus == types.VDA5050ActionStatus.FINISHED:
                     # Update current instant aciton dict
                     finished_instant_actions.append(
                         self._current_instant_actions.pop(action_state.actionId))
-                    self.mission_info(
-                        f"Finished instant action:\n {finished_instant_actions[-1]}")
-                updated_instant_action_ids.append(action_state.actionId)
+                    self.mission_info("Finished instant action:\n %s",
+                                      finished_instant_actions[-1])
+                updated_instant_action_ids.add(action_state.actionId)
 
         # Resend instant actions if they are not in the feedback message
         for action_id, instant_action in self._current_instant_actions.items():
             if action_id not in updated_instant_action_ids:
                 # Resend instant action
                 await self._send_instant_action(instant_action)
-                self.mission_info(
-                    f"Resend {instant_action.actionType} instant action.")
+                self.mission_info("Resend %s instant action.", instant_action.actionType)
         return finished_instant_actions
 
     async def _on_client_message(self, message: types.VDA5050State):
-        self.debug(f"[{message.orderId}] Got feedback")
+        self.debug("[%s] Got feedback", message.orderId)
         # If we have a robot, Update it with the details from the message
         if self._robot_object is not None:
-            # Check if the current task to verify if robot is online still exists
-            if self._robot_online_task is not None:
-                # Cancel to replace with another task to update the online checking time
-                self._robot_online_task.cancel()
-            self._robot_online_task = \
-                asyncio.get_event_loop().create_task(self._check_robot_online())
+            # Push back the time at which the robot is considered offline
+            self._robot_last_seen = self._loop.time()
+            self._robot_seen.set()
+            if self._robot_online_task is None or self._robot_online_task.done():
+                self._robot_online_task = \
+                    self._loop.create_task(self._check_robot_online())
             if message.agvPosition:
                 self._robot_object.status.pose.x = message.agvPosition.x
                 self._robot_object.status.pose.y = message.agvPosition.y
@@ -402,7 +465,7 @@ class Robot:
                     self._set_robot_state(
                         robot_object.RobotStateV1.CHARGING)
                     self._charging_mission_received = False
-                elif (self._robot_object.status.state == robot_object.RobotStateV1.CHARGING and
+                elif (self._robot_object.status.state is robot_object.RobotStateV1.CHARGING and
                       not message.batteryState.charging):
                     self._set_robot_state(
                         robot_object.RobotStateV1.IDLE)
@@ -415,49 +478,12 @@ class Robot:
                                               self._robot_object.battery.recommended_minimum)
                                          and not self._robot_object.status.state.running
                                          and not self._charging_mission_received)
-                if request_map or send_charging_mission:
-                    # Check mission control health
-                    try:
-                        health_response = requests.get(
-                            self._robot_server.mission_ctrl_url + "/api/v1/health")
-                        if health_response.status_code == 200:
-                            # Send map request
-                            if request_map:
-                                response = requests.post(
-                                    self._robot_server.mission_ctrl_url + "/api/v1/push_map",
-                                    params={"robot_name": self._name})
-                                if response.status_code == 200:
-                                    self._set_robot_state(
-                                        robot_object.RobotStateV1.MAP_DEPLOYMENT)
-                                    logging.debug(
-                                        "Map loading request posted successfully for robot %s",
-                                        self._name)
-                                else:
-                                    logging.warning(
-                                        "Failed to post map loading request for robot %s ",
-                                        self._name)
-                            if send_charging_mission:
-                                response = requests.post(
-                                    self._robot_server.mission_ctrl_url+"/api/v1/mission/charging",
-                                    params={"robot_name": self._name})
-                                if response.status_code == 200:
-                                    logging.debug(
-                                        "Charging mission posted successfully for robot %s",
-                                        self._name)
-                                    self._charging_mission_received = True
-                                else:
-                                    logging.warning(
-                                        "Failed to post charging mission for robot %s ",
-                                        self._name)
-                    except requests.exceptions.ConnectionError as err:
-                        # Service doesn't exist, handle accordingly
-                        logging.warning(
-                            "Connection error occurred: \n %s", err)
-                    except requests.exceptions.HTTPError as http_err:
-                        logging.warning("HTTP error occurred: \n %s", http_err)
-                    except requests.exceptions.Timeout as timeout_err:
-                        logging.warning(
-                            "Timeout error occurred: \n %s", timeout_err)
+                # Only one request to mission control can be in flight per robot, the next state
+                # message retries if it is still needed
+                if (request_map or send_charging_mission) and \
+                        (self._mission_control_task is None or self._mission_control_task.done()):
+                    self._mission_control_task = self._loop.create_task(
+                        self._request_mission_control(request_map, send_charging_mission))
             if not self._robot_object.status.online:
                 self.info("Robot Online")
             self._robot_object.status.online = True
@@ -465,14 +491,21 @@ class Robot:
                 for information in message.information:
                     if information.infoType == "user_info":
                         self._robot_object.status.info_messages = \
-                            json.loads(information.infoDescription)
+                            orjson.loads(information.infoDescription)
                         break
             # Update robot unique ID
-            self._robot_object.status.hardware_version = \
-                robot_object.RobotHardwareVersionV1(manufacturer=message.manufacturer,
-                                                    serial_number=message.serialNumber)
-            if self._robot_object.lifecycle is not api_objects.object.ObjectLifecycleV1.DELETED:
-                self._database.update_status(self._robot_object)
+            hardware_version = self._robot_object.status.hardware_version
+            if hardware_version.manufacturer != message.manufacturer or \
+                    hardware_version.serial_number != message.serialNumber:
+                self._robot_object.status.hardware_version = \
+                    robot_object.RobotHardwareVersionV1(manufacturer=message.manufacturer,
+                                                        serial_number=message.serialNumber)
+            # Robots commonly report the same state many times a second, only write the status
+            # when something in it changed
+            if self._robot_object.lifecycle is not api_objects.object.ObjectLifecycleV1.DELETED \
+                    and _robot_status_snapshot(self._robot_object.status) != \
+                    self._robot_status_written:
+                self._update_robot_status()
 
             # Update object detection results if necessary
             for action_state in message.actionStates:
@@ -484,10 +517,10 @@ class Robot:
                             name=self.robot_object.name)
                         self._database.create(self._detection_results_object)
                     self._detection_results_object.status.detected_objects = \
-                        [DetectedObject(**item) for item in json.loads(
+                        [DetectedObject(**item) for item in orjson.loads(
                             action_state.resultDescription)]
 
-                    self._database.update_status(
+                    self._robot_server.update_status(
                         self._detection_results_object)
                     self.info(
                         "Updated object detector information in mission database.")
@@ -505,38 +538,94 @@ class Robot:
             await self.get_next_mission()
             return
 
+        # Order ids have the form "<mission name>-n<mission node index>"
+        order_mission, _, order_node = message.orderId.rpartition("-n")
         # If the order doesn't match, ignore it
-        if message.orderId.rsplit("-n", 1)[0] != str(self._current_mission.name):
-            self.info(f"[{self._current_mission.name}] Got message from another mission order: "
-                      f"{message.orderId}")
+        if order_mission != self._current_mission.name:
+            self.info("[%s] Got message from another mission order: %s",
+                      self._current_mission.name, message.orderId)
             await self._send_order()
             return
 
         prev_child_node = self._current_behavior_tree.current_node.name
-        self.update_mission_state(message, finished_instant_actions)
+        self.update_mission_state(message, int(order_node), finished_instant_actions)
 
         # Resend node requested by the user
         if self._updating_mission_from_api:
-            self.mission_info(f"Resend the updated mission node {prev_child_node}: "
-                              f"{self._current_behavior_tree.current_node.name}")
+            self.mission_info("Resend the updated mission node %s: %s", prev_child_node,
+                              self._current_behavior_tree.current_node.name)
             await self._send_order()
             self._updating_mission_from_api = False
 
         # If current node is updated, then send a new order
         if prev_child_node != self._current_behavior_tree.current_node.name:
-            self.mission_info(f"Update node from {prev_child_node} to "
-                              f"{self._current_behavior_tree.current_node.name}")
+            self.mission_info("Update node from %s to %s", prev_child_node,
+                              self._current_behavior_tree.current_node.name)
             await self._send_order()
 
         if self._current_mission.status.state.done:
             await self.post_mission_completion()
 
+    async def _request_mission_control(self, request_map: bool, send_charging_mission: bool):
+        # The requests are blocking, so they are made from the default executor to not hold up
+        # the messages of every other robot on the event loop
+        mission_ctrl_url = self._robot_server.mission_ctrl_url
+        if mission_ctrl_url is None:
+            return
+        # Check mission control health
+        try:
+            if await self._robot_server.mission_ctrl_healthy():
+                # Send map request
+                if request_map:
+                    response = await self._loop.run_in_executor(None, functools.partial(
+                        requests.post, mission_ctrl_url + "/api/v1/push_map",
+                        params={"robot_name": self._name}))
+                    if response.status_code == 200:
+                        # Messages are handled while the request is made, so the robot may have
+                        # started a mission or received its map in the meantime
+                        robot = self._robot_object
+                        if robot is not None and not robot.status.pose.map_id and \
+                                robot.status.state.can_deploy_map:
+                            self._set_robot_state(
+                                robot_object.RobotStateV1.MAP_DEPLOYMENT)
+                        logging.debug(
+                            "Map loading request posted successfully for robot %s",
+                            self._name)
+                    else:
+                        logging.warning(
+                            "Failed to post map loading request for robot %s ",
+                            self._name)
+                if send_charging_mission:
+                    response = await self._loop.run_in_executor(None, functools.partial(
+                        requests.post, mission_ctrl_url + "/api/v1/mission/charging",
+                        params={"robot_name": self._name}))
+                    if response.status_code == 200:
+                        logging.debug(
+                            "Charging mission posted successfully for robot %s",
+                            self._name)
+                        robot = self._robot_object
+                        if robot is not None and not robot.status.state.running:
+                            self._charging_mission_received = True
+                    else:
+                        logging.warning(
+                            "Failed to post charging mission for robot %s ",
+                            self._name)
+        except requests.exceptions.ConnectionError as err:
+            # Service doesn't exist, handle accordingly
+            logging.warning(
+                "Connection error occurred: \n %s", err)
+        except requests.exceptions.HTTPError as http_err:
+            logging.warning("HTTP error occurred: \n %s", http_err)
+        except requests.exceptions.Timeout as timeout_err:
+            logging.warning(
+                "Timeout error occurred: \n %s", timeout_err)
+
     async def _on_client_factsheet(self, message: types.VDA5050Factsheet):
         if self._robot_object is not None:
             self._robot_object.status.factsheet.agv_class = message.typeSpecification.agvClass
             self._robot_object.status.factsheet.speed_max = message.physicalParameters.speedMax
 
-            self._database.update_status(self._robot_object)
+            self._update_robot_status()
 
     async def post_mission_completion(self):
         # Delete a completed/failure mission
@@ -567,7 +656,7 @@ class Robot:
             return
 
         if name == self._current_mission.name and \
-                self._current_mission.status.state == mission_object.MissionStateV1.RUNNING:
+                self._current_mission.status.state is mission_object.MissionStateV1.RUNNING:
             # In case there is no response from the client
             if await self._robot_server.delete_pending_mission(self._current_mission):
                 return
@@ -583,14 +672,15 @@ class Robot:
                 self._robot_online_task.cancel()
             await self._robot_server.delete_robot(self._name)
 
-    def update_mission_node_state(self, message: types.VDA5050State,
+    def update_mission_node_state(self, message: types.VDA5050State, mission_node_index: int,
                                   finished_instant_actions: List[types.VDA5050Action])\
             -> mission_object.MissionStateV1:
         # Update mission state from robot client
         if self._current_mission is None:
             return mission_object.MissionStateV1.PENDING
-        mission_node_index = int(message.orderId.rsplit("-n", 1)[1])
         current_mission_node = self._current_mission.mission_tree[mission_node_index]
+        # Node names are always filled in when the mission is validated
+        node_name = cast(str, current_mission_node.name)
         task_status = self._current_mission.status.task_status
         # If the last visited node is empty, this is the first order the robot has ran
         if message.lastNodeId == "":
@@ -598,9 +688,9 @@ class Robot:
         else:
             current_order_node_id = message.lastNodeSequenceId + 2
 
-        node_state = self._current_mission.status.node_status[str(
-            current_mission_node.name)].state
-        if current_mission_node.type == mission_object.MissionNodeType.ROUTE and \
+        node_status = self._current_mission.status.node_status[node_name]
+        node_state = node_status.state
+        if current_mission_node.type is mission_object.MissionNodeType.ROUTE and \
                 current_mission_node.route is not None:
             # Find the index of the waypoint that the robot last reached
             # - Nodes are separated by 2 sequenceId, hence we divide by 2
@@ -616,21 +706,21 @@ class Robot:
             if self.last_node_seq_id < message.lastNodeSequenceId and \
                     idx >= 0 and \
                     current_mission_node.route.waypoints[idx].allowedDeviationXY == 0:
-                if current_mission_node.name not in task_status:
-                    task_status[str(current_mission_node.name)] = 0
+                if node_name not in task_status:
+                    task_status[node_name] = 0
                 else:
-                    task_status[str(current_mission_node.name)] += 1
-                self._database.update_status(self._current_mission)
+                    task_status[node_name] += 1
+                self._robot_server.update_status(self._current_mission)
 
             if current_order_node_id == current_mission_node.route.size * 2 + 2:
                 node_state = mission_object.MissionStateV1.COMPLETED
 
-        elif current_mission_node.type == mission_object.MissionNodeType.MOVE and \
+        elif current_mission_node.type is mission_object.MissionNodeType.MOVE and \
                 current_mission_node.move is not None and \
                 current_order_node_id == 1 * 2 + 2:
             node_state = mission_object.MissionStateV1.COMPLETED
         # TODO(Nico): fix the action states index
-        elif current_mission_node.type == mission_object.MissionNodeType.ACTION:
+        elif current_mission_node.type is mission_object.MissionNodeType.ACTION:
             if message.actionStates[0].actionStatus == types.VDA5050ActionStatus.FINISHED:
                 node_state = mission_object.MissionStateV1.COMPLETED
             elif message.actionStates[0].actionStatus == types.VDA5050ActionStatus.FAILED:
@@ -638,7 +728,7 @@ class Robot:
             # Check if this is a teleop action node
             elif message.actionStates[0].actionType == types.NVActionType.PAUSE_ORDER and \
                 self._robot_object is not None and \
-                    self._robot_object.status.state != robot_object.RobotStateV1.TELEOP:
+                    self._robot_object.status.state is not robot_object.RobotStateV1.TELEOP:
                 self._set_robot_state(robot_object.RobotStateV1.TELEOP)
                 self.mission_info("Switch to teleop")
         # Check if there is an instant order cancellation feedback
@@ -654,35 +744,40 @@ class Robot:
             self.warning("Fatal Errors present, failing mission")
             node_state = mission_object.MissionStateV1.FAILED
         # Set mission node state based on update from robot client message
-        self.set_mission_node_state(str(current_mission_node.name), node_state)
+        self.set_mission_node_state(node_name, node_state, node_status)
         return node_state
 
     def get_mission_errors(self, message: types.VDA5050State):
-        fatal_errors = False
-        if len(message.errors) == 0:
+        if not message.errors:
             return False
+        mission = self._current_mission
+        fatal_errors = False
+        node_errors = False
         for error in message.errors:
             # Skip warnings
             if error.errorLevel != types.VDA5050ErrorLevel.FATAL:
                 continue
+            # Without a mission there are no node errors to record, so the first fatal error
+            # is all that matters
+            if mission is None:
+                return True
             fatal_errors = True
             for error_reference in error.errorReferences:
-                if error_reference.referenceKey in \
-                        ["node_id", "nodeId", "action_id", "actionId"]:
+                if error_reference.referenceKey in _NODE_REFERENCE_KEYS:
+                    # Reference values have the form "<mission name>-n<node index>[-s<sequence>]"
                     mission_node_id = \
-                        error_reference.referenceValue.rsplit(
-                            "-n")[-1].rsplit("-s")[0]
+                        error_reference.referenceValue.rpartition("-n")[2].partition("-s")[0]
                     try:
                         mission_node = int(mission_node_id)
                     except ValueError:
                         continue
-                    if self._current_mission is not None and \
-                            mission_node < len(self._current_mission.mission_tree):
-                        (self._current_mission.status.node_status[
-                            str(self._current_mission.mission_tree[mission_node].name)].error_msg) \
-                            = error.errorDescription
-                        self._current_mission.status.failure_reason = "\n".join(
-                            error.errorDescription for error in message.errors)
+                    if mission_node < len(mission.mission_tree):
+                        node_name = cast(str, mission.mission_tree[mission_node].name)
+                        mission.status.node_status[node_name].error_msg = error.errorDescription
+                        node_errors = True
+        if node_errors and mission is not None:
+            mission.status.failure_reason = "\n".join(
+                error.errorDescription for error in message.errors)
         return fatal_errors
 
     def update_mission_from_behavior_tree(self):
@@ -690,7 +785,7 @@ class Robot:
         if self._current_behavior_tree is None or self._current_mission is None:
             return
         # Record the old status and store the new status
-        previous_mission_status = self._current_mission.status.copy(deep=True)
+        previous_mission_status = _mission_status_snapshot(self._current_mission.status)
         # Update mission status
         self._current_behavior_tree.update()
         self._current_mission.status.current_node = self._current_behavior_tree.current_node.idx
@@ -698,10 +793,10 @@ class Robot:
             self._current_behavior_tree.status)
         mission_state_updated = self._set_mission_state(current_state)
         # In case mission node status get updated but mission state remains the same
-        if not mission_state_updated and previous_mission_status != self._current_mission.status:
-            self.info(
-                f"update mission node: {self._current_mission.status.current_node}")
-            self._database.update_status(self._current_mission)
+        if not mission_state_updated and \
+                previous_mission_status != _mission_status_snapshot(self._current_mission.status):
+            self.info("update mission node: %s", self._current_mission.status.current_node)
+            self._robot_server.update_status(self._current_mission)
 
     def update_robot_state(self, finished_instant_actions: List[types.VDA5050Action]):
         """ Update robot states after teleop is finished
@@ -721,7 +816,7 @@ class Robot:
                 self.mission_info("Stop teleop")
             return
 
-    def update_mission_state(self, message: types.VDA5050State,
+    def update_mission_state(self, message: types.VDA5050State, mission_node_index: int,
                              finished_instant_actions: List):
         # Update mission state from both robot feedback and behavior tree
         # Do nothing if there is no mission
@@ -730,8 +825,8 @@ class Robot:
             return
 
         node_state = self.update_mission_node_state(
-            message, finished_instant_actions)
-        if node_state == mission_object.MissionStateV1.CANCELED:
+            message, mission_node_index, finished_instant_actions)
+        if node_state is mission_object.MissionStateV1.CANCELED:
             if self._current_mission.needs_canceled:
                 self._set_mission_state(mission_object.MissionStateV1.CANCELED)
             else:
@@ -743,87 +838,95 @@ class Robot:
     async def run(self):
         while self._alive:
             message = await self._messages.get()
-            # If this is a robot object
-            if isinstance(message, api_objects.RobotObjectV1):
-                await self._on_robot_change(message)
-            elif isinstance(message, api_objects.MissionObjectV1):
-                await self._on_mission_change(message)
-            elif isinstance(message, types.VDA5050State):
-                await self._on_client_message(message)
-            elif isinstance(message, types.VDA5050Factsheet):
-                await self._on_client_factsheet(message)
+            handler = self._message_handlers.get(type(message))
+            if handler is not None:
+                await handler(message)
 
     async def send_message(self, message):
+        # Only warn when the backlog first reaches the limit, not for every message past it
+        if self._messages.qsize() == ROBOT_MESSAGE_BACKLOG_WARNING:
+            self.warning("%d messages are waiting to be processed", ROBOT_MESSAGE_BACKLOG_WARNING)
         await self._messages.put(message)
 
-    def info(self, message: str):
-        self._logger.info(
-            "[Isaac Mission Dispatch] | INFO: [%s] %s", self._name, message)
+    # The logging helpers take "%" style args, which are only formatted if the message is logged
+
+    def info(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("[Isaac Mission Dispatch] | INFO: [%s] %s", self._name,
+                              message % args if args else message)
 
-    def mission_info(self, message: str):
+    def mission_info(self, message: str, *args):
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         if self._current_mission is not None:
             mission = "Mission ID - " + self._current_mission.name
         else:
             mission = "None"
         self._logger.info("[Isaac Mission Dispatch] | INFO: [%s] [%s] %s",
-                          self._name, mission, message)
+                          self._name, mission, message % args if args else message)
 
-    def debug(self, message: str):
-        self._logger.debug(
-            "[Isaac Mission Dispatch] | DEBUG: [%s] %s", self._name, message)
+    def debug(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("[Isaac Mission Dispatch] | DEBUG: [%s] %s", self._name,
+                               message % args if args else message)
 
-    def warning(self, message: str):
-        self._logger.warning(
-            "[Isaac Mission Dispatch] | WARNING: [%s] %s", self._name, message)
+    def warning(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning("[Isaac Mission Dispatch] | WARNING: [%s] %s", self._name,
+                                 message % args if args else message)
 
     def _set_robot_state(self, state: robot_object.RobotStateV1):
         if self._robot_object is None or state == self._robot_object.status.state:
             return
-        self.info(f"Robot state: {self._robot_object.status.state} -> {state}")
+        self.info("Robot state: %s -> %s", self._robot_object.status.state, state)
         if self._robot_server.push_telemetry:
             prev_state_timestamp = self._cur_robot_state_timestamp
-            self._cur_robot_state_timestamp = datetime.datetime.now()
-            duration = (self._cur_robot_state_timestamp -
-                        prev_state_timestamp).total_seconds()
+            self._cur_robot_state_timestamp = self._loop.time()
+            duration = self._cur_robot_state_timestamp - prev_state_timestamp
             robot_metrics = {
                 f"{self._robot_object.status.state.value}.duration": duration}
             self._telemetry.add_kpi(
                 self._robot_object.name, robot_metrics, metrics.Timeframe.ROBOT)
-            self._telemetry_client.send_telemetry(self._telemetry.get_kpis_by_frequency(
+            self._robot_server.send_telemetry(self._telemetry.get_kpis_by_frequency(
                 metrics.Timeframe.ROBOT))
         self._robot_object.status.state = state
-        self._database.update_status(self._robot_object)
+        self._update_robot_status()
+
+    def _update_robot_status(self):
+        if self._robot_object is None:
+            return
+        self._robot_status_written = _robot_status_snapshot(self._robot_object.status)
+        self._robot_server.update_status(self._robot_object)
 
     def _set_mission_state(self, state: mission_object.MissionStateV1):
         if self._current_mission is None or state == self._current_mission.status.state:
             return False
-        self.mission_info(
-            f"Mission state: {self._current_mission.status.state} -> {state}")
+        self.mission_info("Mission state: %s -> %s", self._current_mission.status.state, state)
         self._current_mission.status.state = state
         self._current_mission.status.node_status["root"].state = state
-        if state == mission_object.MissionStateV1.RUNNING:
+        if state is mission_object.MissionStateV1.RUNNING:
             # If the mission just moved to RUNNING, set the start timestamp
             if self._current_mission.status.start_timestamp is None:
                 self._current_mission.status.start_timestamp = datetime.datetime.now()
                 self._set_robot_state(robot_object.RobotStateV1.ON_TASK)
-                self.mission_info(
-                    f"Mission started at {self._current_mission.status.start_timestamp}")
+                self.mission_info("Mission started at %s",
+                                  self._current_mission.status.start_timestamp)
         elif state.done:
             self._current_mission.status.end_timestamp = datetime.datetime.now()
             # If the mission just moved to COMPLETED, record the end timestamp
-            if state == mission_object.MissionStateV1.COMPLETED:
-                self.mission_info(
-                    f"Mission completed at {self._current_mission.status.end_timestamp}")
+            if state is mission_object.MissionStateV1.COMPLETED:
+                self.mission_info("Mission completed at %s",
+                                  self._current_mission.status.end_timestamp)
             # If the mission just moved to CANCELED, record the end timestamp
-            elif state == mission_object.MissionStateV1.CANCELED:
-                self.mission_info(
-                    f"Mission cancelled at {self._current_mission.status.end_timestamp}")
+            elif state is mission_object.MissionStateV1.CANCELED:
+                self.mission_info("Mission cancelled at %s",
+                                  self._current_mission.status.end_timestamp)
             # If the mission just moved to FAILED, record the reason and end timestamp
-            elif state == mission_object.MissionStateV1.FAILED:
-                self.mission_info(
-                    f"Mission failed at {self._current_mission.status.end_timestamp}")
-                self.mission_info(
-                    f"Failure reason: {self._current_mission.status.failure_reason}")
+            elif state is mission_object.MissionStateV1.FAILED:
+                self.mission_info("Mission failed at %s",
+                                  self._current_mission.status.end_timestamp)
+                self.mission_info("Failure reason: %s",
+                                  self._current_mission.status.failure_reason)
 
             if self._robot_server.push_telemetry:
                 telem = {}  # type: Dict[str, Union[int, str]]
@@ -834,49 +937,58 @@ class Robot:
                     "mission_fate",
                     telem,
                     metrics.Timeframe.MISSION)
-                self._telemetry_client.send_telemetry(
+                self._robot_server.send_telemetry(
                     self._telemetry.get_kpis_by_frequency(
                         metrics.Timeframe.MISSION))
                 self._telemetry.clear_frequency(metrics.Timeframe.MISSION)
 
         if self._current_mission.status.start_timestamp is not None and \
                 self._current_mission.status.end_timestamp is not None:
-            self.mission_info("Mission duration: "
-                              f"""{self._current_mission.status.end_timestamp -
-                                   self._current_mission.status.start_timestamp}""")
-        self._database.update_status(self._current_mission)
+            self.mission_info("Mission duration: %s",
+                              self._current_mission.status.end_timestamp -
+                              self._current_mission.status.start_timestamp)
+        self._robot_server.update_status(self._current_mission)
         return True
 
-    def set_mission_node_state(self, node_name: str, state: mission_object.MissionStateV1):
+    def set_mission_node_state(self, node_name: str, state: mission_object.MissionStateV1,
+                               node_status: Optional[mission_object.MissionNodeStatusV1] = None):
         if self._current_mission is None:
             return
-        previous_state = self._current_mission.status.node_status[node_name].state
+        if node_status is None:
+            node_status = self._current_mission.status.node_status[node_name]
+        previous_state = node_status.state
         if previous_state == state:
             return
-        self.mission_info(f"Node {node_name}: {previous_state} -> {state}")
-        self._current_mission.status.node_status[node_name].state = state
+        self.mission_info("Node %s: %s -> %s", node_name, previous_state, state)
+        node_status.state = state
 
-    def _process_notify_node(self, mission_node):
+    async def _process_notify_node(self, mission_node):
+        # The notify request is blocking, so it is made from the default executor and retries
+        # back off with a sleep instead of holding up every other robot on the event loop
         self.set_mission_node_state(f"{mission_node.name}",
                                     mission_object.MissionStateV1.RUNNING)
         retries = 0
-        while retries <= 3:
-            response = requests.post(url=mission_node.notify.url,
-                                     json=mission_node.notify.json_data,
-                                     timeout=mission_node.notify.timeout)
+        while retries <= NOTIFY_MAX_RETRIES:
+            response = await self._loop.run_in_executor(None, functools.partial(
+                requests.post, url=mission_node.notify.url,
+                json=mission_node.notify.json_data,
+                timeout=mission_node.notify.timeout))
             if response.status_code == 200:
                 self.set_mission_node_state(f"{mission_node.name}",
                                             mission_object.MissionStateV1.COMPLETED)
                 break
             elif response.status_code in [408, 425, 429, 500, 502, 503, 504]:
-                self.mission_info(
-                    f"Notify: {response.status_code} received, retrying")
+                backoff = min(NOTIFY_BACKOFF_CAP, NOTIFY_BACKOFF_BASE * 2 ** retries)
+                self.mission_info("Notify: %s received, retrying in %.1fs",
+                                  response.status_code, backoff)
                 retries += 1
+                if retries <= NOTIFY_MAX_RETRIES:
+                    await asyncio.sleep(backoff)
             else:
                 self.set_mission_node_state(f"{mission_node.name}",
                                             mission_object.MissionStateV1.FAILED)
                 break
-        if retries > 3:
+        if retries > NOTIFY_MAX_RETRIES:
             self.set_mission_node_state(f"{mission_node.name}",
                                         mission_object.MissionStateV1.FAILED)
 
@@ -889,6 +1001,60 @@ class Robot:
         return self._robot_object
 
 
+class StatusWriter:
+    """Writes the status of objects to the database from a thread, so the writes do not block the
+    event loop. Statuses queued while a write is in progress are coalesced per object"""
+
+    def __init__(self, database: db_client.DatabaseClient, warning: Callable[..., None]):
+        self._database = database
+        self._warning = warning
+        # None tells the thread to stop once everything queued before it is written
+        self._updates: thread_queue.Queue[Optional[Tuple[str, str, str]]] = thread_queue.Queue()
+        self._thread = threading.Thread(group=None, target=self._write_status_updates)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Writes the statuses that are already queued and then stops the thread"""
+        self._updates.put(None)
+        self._thread.join()
+
+    def update_status(self, obj: api_objects.ApiObject):
+        """Queues the status of an object to be written. The status is serialized now so later
+        changes to the object are not written before they are queued"""
+        self._updates.put((obj.ALIAS, obj.name, obj.status.json()))
+
+    def update_status_json(self, alias: str, name: str, status: str):
+        """Queues an already serialized status to be written"""
+        self._updates.put((alias, name, status))
+
+    def _write_status_updates(self):
+        stopped = False
+        while not stopped:
+            update = self._updates.get()
+            batch: Dict[Tuple[str, str], str] = {}
+            while update is not None:
+                alias, name, status = update
+                # Only the latest status of each object needs to be written
+                batch[(alias, name)] = status
+                if len(batch) >= STATUS_UPDATE_BATCH_SIZE:
+                    break
+                try:
+                    update = self._updates.get_nowait()
+                except thread_queue.Empty:
+                    break
+            stopped = update is None
+            for (alias, name), status in batch.items():
+                try:
+                    self._database.update_status_json(alias, name, status)
+                except Exception as err:  # pylint: disable=broad-except
+                    # The object may have been deleted after its status was queued, or the
+                    # database may be unreachable, neither should stop the writer thread
+                    self._warning("Failed to update status of %s %s: %s", alias, name, err)
+
+
 class RobotServer:
     """Handles sending missions to robots using the VDA5050 protocol"""
 
@@ -912,6 +1078,7 @@ class RobotServer:
 
         # Save parameters to use later
         self._mqtt_prefix = mqtt_prefix
+        self._topic_prefix = f"{mqtt_prefix}/"
 
         # Connect to the db
         self._database = db_client.DatabaseClient(database_url)
@@ -922,7 +1089,10 @@ class RobotServer:
         )
         self._robot_changes: asyncio.Queue[api_objects.RobotObjectV1] = asyncio.Queue(
         )
-        self._mqtt_messages: asyncio.Queue[ClientMessage] = asyncio.Queue()
+        # MQTT messages are appended from the paho network thread and drained in batches on the
+        # event loop, which is woken up through the event
+        self._mqtt_messages: deque[ClientMessage] = deque()
+        self._mqtt_messages_ready = asyncio.Event()
 
         # Launch threads to listen for updates to robot / mission objects
         mission_update_args = (
@@ -935,6 +1105,9 @@ class RobotServer:
                                                      args=robot_update_args)
         self._robot_update_thread.daemon = True
 
+        # Write status updates to the database off of the event loop
+        self._status_writer = StatusWriter(self._database, self.warning)
+
         # Connect to MQTT
         self._mqtt_client = \
             self._connect_to_mqtt(mqtt_host, mqtt_port,
@@ -943,39 +1116,96 @@ class RobotServer:
 
         # The robot objects
         self._robots: Dict[str, Robot] = {}
+        # Names of robots that MQTT messages were ignored from, so they are only warned about once
+        self._unknown_robots: Set[str] = set()
 
         # Mission control
         self.mission_ctrl_url = mission_ctrl_url
         self.push_telemetry = push_telemetry
         self.disable_request_factsheet = disable_request_factsheet
         self.telemetry_env = telemetry_env
+        # Telemetry from all robots is sent by one sender from its own thread
+        self._telemetry_updates: thread_queue.Queue[Dict] = thread_queue.Queue()
+        self._telemetry_thread: Optional[threading.Thread] = None
+        if push_telemetry:
+            self._telemetry_client = TelemetrySender(telemetry_env)
+            self._telemetry_thread = threading.Thread(group=None,
+                                                      target=self._send_telemetry_updates)
+            self._telemetry_thread.daemon = True
+        # The last mission control health check, shared by all robots
+        self._mission_ctrl_healthy = False
+        self._mission_ctrl_health_checked = float("-inf")
+        self._mission_ctrl_health_lock = asyncio.Lock()
+
+    async def mission_ctrl_healthy(self) -> bool:
+        """Returns whether mission control is healthy. A health check result is reused for
+        MISSION_CTRL_HEALTH_PERIOD seconds, and robots asking at the same time share one check"""
+        async with self._mission_ctrl_health_lock:
+            if self.mission_ctrl_url is not None and self._event_loop.time() - \
+                    self._mission_ctrl_health_checked >= MISSION_CTRL_HEALTH_PERIOD:
+                try:
+                    response = await self._event_loop.run_in_executor(
+                        None, requests.get, self.mission_ctrl_url + "/api/v1/health")
+                    self._mission_ctrl_healthy = response.status_code == 200
+                except requests.exceptions.RequestException:
+                    self._mission_ctrl_healthy = False
+                    raise
+                finally:
+                    self._mission_ctrl_health_checked = self._event_loop.time()
+        return self._mission_ctrl_healthy
+
+    def send_telemetry(self, kpis: Dict):
+        """Queues telemetry to be sent by the telemetry thread"""
+        # Copy the KPIs since robots keep adding to their telemetry after this returns
+        self._telemetry_updates.put({frequency: dict(values) for frequency, values in kpis.items()})
+
+    def _send_telemetry_updates(self):
+        while True:
+            kpis = self._telemetry_updates.get()
+            try:
+                self._telemetry_client.send_telemetry(kpis)
+            except Exception as err:  # pylint: disable=broad-except
+                self.warning("Failed to send telemetry: %s", err)
 
     def _enqueue(self, queue, obj):
-        asyncio.run_coroutine_threadsafe(queue.put(obj), self._event_loop)
+        # The change queues are unbounded, so put_nowait never raises and can be scheduled
+        # directly instead of wrapping queue.put() in a coroutine and a future
+        self._event_loop.call_soon_threadsafe(queue.put_nowait, obj)
+
+    def _enqueue_mqtt_message(self, message: ClientMessage):
+        self._mqtt_messages.append(message)
+        # The event only needs to be set once per batch, the event loop clears it before draining
+        if not self._mqtt_messages_ready.is_set():
+            self._event_loop.call_soon_threadsafe(self._mqtt_messages_ready.set)
+
+    def update_status(self, obj: api_objects.ApiObject):
+        """Queues the status of an object to be written to the database"""
+        self._status_writer.update_status(obj)
 
     def _mqtt_on_connect(self, client, userdata, flags, rc):
         client.subscribe(f"{self._mqtt_prefix}/+/state")
         client.subscribe(f"{self._mqtt_prefix}/+/factsheet")
 
     def _mqtt_on_message(self, client, userdata, msg):
-        state_match = re.match(f"{self._mqtt_prefix}/(.*)/state", msg.topic)
-        factsheet_match = re.match(
-            f"{self._mqtt_prefix}/(.*)/factsheet", msg.topic)
+        # Topics have the form "<prefix>/<robot>/<state|factsheet>"
+        robot, topic_type = "", ""
+        if msg.topic.startswith(self._topic_prefix):
+            robot, _, topic_type = msg.topic[len(self._topic_prefix):].rpartition("/")
+        # The payloads are decoded from bytes with orjson directly, parse_raw would first decode
+        # them to a str
         try:
-            if state_match:
-                robot = state_match.groups()[0]
-                pl = msg.payload
-                self._enqueue(self._mqtt_messages, ClientStatusMessage(name=robot,
-                                                                       payload=json.loads(pl)))
-            elif factsheet_match:
-                robot = factsheet_match.groups()[0]
-                pl = msg.payload
-                self._enqueue(self._mqtt_messages, ClientFactsheetMessage(name=robot,
-                                                                          payload=json.loads(pl)))
+            if robot and topic_type == "state":
+                state = types.VDA5050State.parse_obj(orjson.loads(msg.payload))
+                self._enqueue_mqtt_message((robot, state))
+            elif robot and topic_type == "factsheet":
+                factsheet = types.VDA5050Factsheet.parse_obj(orjson.loads(msg.payload))
+                self._enqueue_mqtt_message((robot, factsheet))
             else:
                 self.warning(
                     f"Got message from unrecognized topic \"{msg.topic}\"")
                 return
+        except orjson.JSONDecodeError as e:
+            self.warning(f"Invalid JSON in client message on \"{msg.topic}\": {e}")
         except pydantic.ValidationError as e:
             self.warning(f"Validation error from client message:\n{e.errors()}")
 
@@ -1004,14 +1234,13 @@ class RobotServer:
         return client
 
     async def stop(self):
-        loop = asyncio.get_event_loop()
-        loop.stop()
+        self._event_loop.stop()
 
     def _watch_changes(self, obj: Any, queue: asyncio.Queue):
         while True:
             try:
                 for update in self._database.watch(obj):
-                    self.debug(f"Watch object update: {obj.get_alias()}")
+                    self.debug("Watch object update: %s", obj.ALIAS)
                     self._enqueue(queue, update)
             except requests.exceptions.ConnectionError:
                 self.warning("Failed to connect to mission-database, retrying in "
@@ -1032,11 +1261,11 @@ class RobotServer:
                 continue
             # Robots being deleted may not have a name
             if hasattr(robot, "name"):
-                if robot.name not in self._robots:
-                    self.debug(f"Got robot from database {robot.name}")
-                    self._robots[robot.name] = Robot(robot.name, self._database,
-                                                     self._mqtt_client, self._mqtt_prefix, self)
-                await self._robots[robot.name].send_message(robot)
+                controller = self._robots.get(robot.name)
+                if controller is None:
+                    self.debug("Got robot from database %s", robot.name)
+                    controller = self._add_robot(robot.name)
+                await controller.send_message(robot)
 
     async def _handle_mission_changes(self):
         while True:
@@ -1054,20 +1283,32 @@ class RobotServer:
                 continue
 
             # Put the mission into the queue for the correct robot object
-            if mission.robot not in self._robots:
-                self.debug(f"Got new mission from database {mission.name}")
-                self._robots[mission.robot] = Robot(mission.robot, self._database,
-                                                    self._mqtt_client, self._mqtt_prefix, self)
-            await self._robots[mission.robot].send_message(mission)
+            robot = self._robots.get(mission.robot)
+            if robot is None:
+                self.debug("Got new mission from database %s", mission.name)
+                robot = self._add_robot(mission.robot)
+            await robot.send_message(mission)
 
     async def _handle_mqtt_messages(self):
         while True:
-            message = await self._mqtt_messages.get()
-            if message.name not in self._robots:
-                self.warning(
-                    f"Ignoring MQTT message from unknown robot \"{message.name}\"")
-                continue
-            await self._robots[message.name].send_message(message.payload)
+            await self._mqtt_messages_ready.wait()
+            self._mqtt_messages_ready.clear()
+            while self._mqtt_messages:
+                name, payload = self._mqtt_messages.popleft()
+                robot = self._robots.get(name)
+                if robot is None:
+                    # Only warn once per robot, an unknown robot usually keeps publishing
+                    if name not in self._unknown_robots:
+                        self._unknown_robots.add(name)
+                        self.warning("Ignoring MQTT messages from unknown robot \"%s\"", name)
+                    continue
+                await robot.send_message(payload)
+
+    def _add_robot(self, name: str) -> Robot:
+        robot = Robot(name, self._database, self._mqtt_client, self._mqtt_prefix, self)
+        self._robots[name] = robot
+        self._unknown_robots.discard(name)
+        return robot
 
     async def _run(self):
         await asyncio.gather(
@@ -1076,7 +1317,7 @@ class RobotServer:
             self._handle_mqtt_messages())
 
     async def delete_robot(self, robot_name: str):
-        robot = self._robots[robot_name]
+        robot = self._robots.get(robot_name)
         if robot is not None:
             properties = robot.robot_object
             if properties is not None:
@@ -1089,7 +1330,7 @@ class RobotServer:
                 api_objects.object.ObjectLifecycleV1.PENDING_DELETE:
             self._database.delete(
                 api_objects.MissionObjectV1, mission.name)
-            self.info(f"Deleted mission {mission.name}")
+            self.info("Deleted mission %s", mission.name)
             return True
         return False
 
@@ -1097,14 +1338,25 @@ class RobotServer:
         # Start threads and corroutines
         self._mission_update_thread.start()
         self._robot_update_thread.start()
+        self._status_writer.start()
+        if self._telemetry_thread is not None:
+            self._telemetry_thread.start()
         self._mqtt_client.loop_start()
         self._event_loop.run_until_complete(self._run())
 
-    def info(self, message: str):
-        self._logger.info("[Isaac Mission Dispatch] | INFO: %s", message)
+    # The logging helpers take "%" style args, which are only formatted if the message is logged
+
+    def info(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("[Isaac Mission Dispatch] | INFO: %s",
+                              message % args if args else message)
 
-    def debug(self, message: str):
-        self._logger.debug("[Isaac Mission Dispatch] | DEBUG: %s", message)
+    def debug(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("[Isaac Mission Dispatch] | DEBUG: %s",
+                               message % args if args else message)
 
-    def warning(self, message: str):
-        self._logger.warning("[Isaac Mission Dispatch] | WARNING: %s", message)
+    def warning(self, message: str, *args):
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning("[Isaac Mission Dispatch] | WARNING: %s",
+                                 message % args if args else message)
@@ -0,0 +1,100 @@
+"""
+SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+Copyright (c) 2021-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+import asyncio
+import unittest
+
+from cloud_common import objects as api_objects
+from packages.controllers.mission import server as mission_server
+import packages.controllers.mission.vda5050_types as types
+
+# How long to wait in seconds for the robot to send an instant action before failing the test
+WAIT_TIMEOUT = 5
+
+
+class StubDatabase:
+    """ A database without any objects in it """
+
+    def get(self, object_type, name):
+        raise api_objects.common.ICSError(f"{object_type.ALIAS} {name} does not exist")
+
+
+class StubMqttClient:
+    """ Records the messages published to robots instead of sending them """
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload):
+        self.published.append((topic, payload))
+
+
+class StubRobotServer:
+    """ A robot server with telemetry disabled that requests factsheets from new robots """
+    push_telemetry = False
+    disable_request_factsheet = False
+
+
+class TestInstantActions(unittest.TestCase):
+    def test_repeated_instant_action_state(self):
+        """ Test that an instant action reported more than once does not hide other ones """
+        mqtt_client = StubMqttClient()
+
+        async def wait_for_published(count: int):
+            while len(mqtt_client.published) < count:
+                await asyncio.sleep(0)
+
+        async def handle_feedback():
+            robot = mission_server.Robot("test01", StubDatabase(), mqtt_client,
+                                         "uagv/v2/RobotCompany", StubRobotServer())
+            # A new robot is sent a factsheet request, then switching it to teleop sends a
+            # start teleop action
+            robot_object = api_objects.RobotObjectV1(
+                name="test01", status={}, **api_objects.RobotObjectV1.default_spec())
+            await robot.send_message(robot_object)
+            await asyncio.wait_for(wait_for_published(1), WAIT_TIMEOUT)
+            await robot.send_message(robot_object.copy(update={"switch_teleop": True}))
+            await asyncio.wait_for(wait_for_published(2), WAIT_TIMEOUT)
+            mqtt_client.published.clear()
+
+            # The robot reports the teleop action twice after the factsheet request
+            action_states = [
+                types.VDA5050ActionState(
+                    actionId="instantaction-n0",
+                    actionType=types.VDA5050InstantActionType.FACTSHEET_REQUEST,
+                    actionStatus=types.VDA5050ActionStatus.RUNNING),
+                types.VDA5050ActionState(
+                    actionId="instantaction-n1",
+                    actionType=types.NVInstantActionType.START_TELEOP,
+                    actionStatus=types.VDA5050ActionStatus.RUNNING),
+                types.VDA5050ActionState(
+                    actionId="instantaction-n1",
+                    actionType=types.NVInstantActionType.START_TELEOP,
+                    actionStatus=types.VDA5050ActionStatus.RUNNING),
+            ]
+            message = types.VDA5050State.construct(actionStates=action_states)
+            return await robot.handle_instant_action(message)
+
+        finished = asyncio.run(handle_feedback())
+        self.assertEqual(finished, [])
+        # Both instant actions were reported, so neither of them is resent
+        self.assertEqual(mqtt_client.published, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
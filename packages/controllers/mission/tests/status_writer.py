@@ -0,0 +1,86 @@
+"""
+SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+Copyright (c) 2021-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+import threading
+import unittest
+
+import requests
+
+from packages.controllers.mission import server as mission_server
+
+# How long to wait in seconds for the status writer before failing a test
+WAIT_TIMEOUT = 5
+
+
+class FakeDatabase:
+    """ Records the status writes of a status writer and can fail the first ones """
+
+    def __init__(self, failures: int = 0):
+        self.writes = []
+        self.attempts = 0
+        self._failures = failures
+        self._condition = threading.Condition()
+
+    def update_status_json(self, alias: str, name: str, status: str):
+        with self._condition:
+            self.attempts += 1
+            self._condition.notify_all()
+            if self._failures > 0:
+                self._failures -= 1
+                raise requests.exceptions.Timeout("Timed out")
+            self.writes.append((alias, name, status))
+
+    def wait_for_attempts(self, attempts: int) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self.attempts >= attempts, WAIT_TIMEOUT)
+
+
+class TestStatusWriter(unittest.TestCase):
+    def setUp(self):
+        self.warnings = []
+
+    def warning(self, message: str, *args):
+        self.warnings.append(message % args)
+
+    def test_coalesce_status_updates(self):
+        """ Test that only the latest queued status of each object is written """
+        database = FakeDatabase()
+        writer = mission_server.StatusWriter(database, self.warning)
+        writer.update_status_json("robot", "test01", "1")
+        writer.update_status_json("mission", "mission01", "2")
+        writer.update_status_json("robot", "test01", "3")
+        writer.start()
+        writer.stop()
+        self.assertEqual(database.writes, [("robot", "test01", "3"),
+                                           ("mission", "mission01", "2")])
+
+    def test_failed_status_update(self):
+        """ Test that status updates are still written after a write fails """
+        database = FakeDatabase(failures=1)
+        writer = mission_server.StatusWriter(database, self.warning)
+        writer.start()
+        writer.update_status_json("robot", "test01", "1")
+        self.assertTrue(database.wait_for_attempts(1))
+        writer.update_status_json("robot", "test01", "2")
+        writer.stop()
+        self.assertEqual(database.writes, [("robot", "test01", "2")])
+        self.assertEqual(len(self.warnings), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
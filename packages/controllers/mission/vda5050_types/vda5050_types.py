@@ -303,7 +303,7 @@ class VDA5050Info(pydantic.BaseModel):
     infoLevel: str
 
 
-class VDA5050Order(pydantic.BaseModel):
+class VDA5050Order(common.JsonModel):
     """VDA5050 Order message sent from mission server to robot"""
     headerId: int = 0
     timestamp: str = ""
@@ -389,7 +389,9 @@ class VDA5050Order(pydantic.BaseModel):
             edges += [VDA5050Edge.from_mission_order(mission_id,
                                                      e * 2 + 1, mission_node_id)
                       for e in range(route.size)]
-        return VDA5050Order(
+        # The nodes and edges are built above from already validated models, and always have one
+        # more node than edges, so the order does not need to be validated again
+        return cls.construct(
             orderId=f"{mission_id}-n{mission_node_id}",
             orderUpdateId=0,
             nodes=nodes,
@@ -408,7 +410,7 @@ class VDA5050Order(pydantic.BaseModel):
                                         move, mission_id, mission_node_id, 2)]
         edges += [VDA5050Edge.from_mission_order(
             mission_id, 1, mission_node_id)]
-        return VDA5050Order(
+        return cls.construct(
             orderId=f"{mission_id}-n{mission_node_id}",
             orderUpdateId=0,
             nodes=nodes,
@@ -427,7 +429,7 @@ class VDA5050Order(pydantic.BaseModel):
             nodes[0].actions += [VDA5050Action.from_mission_action(action,
                                                                    nodes[0].nodeId,
                                                                    mission_node_id)]
-        return VDA5050Order(
+        return cls.construct(
             orderId=f"{mission_id}-n{mission_node_id}",
             orderUpdateId=0,
             nodes=nodes,
@@ -490,7 +492,7 @@ class VDA5050SafetyStatus(pydantic.BaseModel):
         return v
 
 
-class VDA5050State(pydantic.BaseModel):
+class VDA5050State(common.JsonModel):
     """Feedback on the current mission and robot status from the client"""
     headerId: int
     timestamp: str
@@ -573,7 +575,7 @@ class VDA5050LocalizationParameters(pydantic.BaseModel):
     temporary: int
 
 
-class VDA5050Factsheet(pydantic.BaseModel):
+class VDA5050Factsheet(common.JsonModel):
     """Specification information specific to each robot type"""
     headerId: int = 0
     timestamp: str = ""
@@ -589,7 +591,7 @@ class VDA5050Factsheet(pydantic.BaseModel):
     localizationParameters: Optional[VDA5050LocalizationParameters]
 
 
-class VDA5050Visualization(pydantic.BaseModel):
+class VDA5050Visualization(common.JsonModel):
     """For a near real-time position and velocity update of the AGV"""
     headerId: int
     timestamp: str
@@ -600,7 +602,7 @@ class VDA5050Visualization(pydantic.BaseModel):
     velocity: Optional[VDA5050Velocity]
 
 
-class VDA5050InstantActions(pydantic.BaseModel):
+class VDA5050InstantActions(common.JsonModel):
     """Instant Action"""
     headerId: int
     timestamp: str
@@ -616,7 +618,7 @@ class VDA5050ConnectionState(str, enum.Enum):
     ONLINE = "ONLINE"
 
 
-class VDA5050Connection(pydantic.BaseModel):
+class VDA5050Connection(common.JsonModel):
     """Connection"""
     headerId: int
     timestamp: str
@@ -18,11 +18,14 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import json
+import threading
 from typing import Any, List, Optional, Dict
 import uuid
 import requests
 import logging
 
+import orjson
+
 from cloud_common import objects
 from cloud_common.objects.mission import MissionObjectV1, MissionRouteNodeV1
 from cloud_common.objects.detection_results import DetectionResultsObjectV1
@@ -37,49 +40,65 @@ class DatabaseClient:
         self._url = url
         self._publisher_id = str(uuid.uuid4())
         self._logger = logging.getLogger("Isaac Mission Dispatch")
+        # Sessions keep connections to the database alive between requests. The client is used
+        # from several threads, so each thread gets its own session.
+        self._sessions = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = requests.Session()
+        return session
 
     def create(self, obj: objects.ApiObject):
-        url = f"{self._url}/{obj.get_alias()}"
+        url = f"{self._url}/{obj.ALIAS}"
         fields = json.loads(obj.spec.json())
         fields["name"] = obj.name
-        response = requests.post(url, json=fields, params={
-                                 "publisher_id": self._publisher_id})
+        response = self._session.post(url, json=fields, params={
+                                      "publisher_id": self._publisher_id})
         common.handle_response(response)
 
     def update_spec(self, obj: objects.ApiObject):
-        url = f"{self._url}/{obj.get_alias()}/{obj.name}"
-        response = requests.put(url, json=json.loads(obj.spec.json()),
-                                params={"publisher_id": self._publisher_id})
+        url = f"{self._url}/{obj.ALIAS}/{obj.name}"
+        response = self._session.put(url, json=json.loads(obj.spec.json()),
+                                     params={"publisher_id": self._publisher_id})
         common.handle_response(response)
 
     def update_status(self, obj: objects.ApiObject):
-        url = f"{self._url}/{obj.get_alias()}/{obj.name}"
-        response = requests.put(url, json={"status": json.loads(obj.status.json())},
-                                params={"publisher_id": self._publisher_id})
+        self.update_status_json(obj.ALIAS, obj.name, obj.status.json())
+
+    def update_status_json(self, alias: str, name: str, status: str):
+        """Updates the status of an object from its already serialized json"""
+        url = f"{self._url}/{alias}/{name}"
+        response = self._session.put(url, data=f"{{\"status\": {status}}}".encode(),
+                                     headers={"Content-Type": "application/json"},
+                                     params={"publisher_id": self._publisher_id})
         common.handle_response(response)
 
     def list(self, object_type: Any, params: Optional[Dict] = None) -> List[objects.ApiObject]:
-        url = f"{self._url}/{object_type.get_alias()}"
-        response = requests.get(url, params=params)
+        url = f"{self._url}/{object_type.ALIAS}"
+        response = self._session.get(url, params=params)
         common.handle_response(response)
-        return [object_type(**obj) for obj in json.loads(response.text)]
+        # Decoded from bytes with orjson, like the parse_raw calls in get and watch
+        return [object_type.parse_obj(obj) for obj in orjson.loads(response.content)]
 
     def get(self, object_type: Any, name: str) -> objects.ApiObject:
-        url = f"{self._url}/{object_type.get_alias()}/{name}"
-        response = requests.get(url)
+        url = f"{self._url}/{object_type.ALIAS}/{name}"
+        response = self._session.get(url)
         common.handle_response(response)
-        return object_type(**json.loads(response.text))
+        return object_type.parse_raw(response.text)
 
     def watch(self, object_type: Any):
-        url = f"{self._url}/{object_type.get_alias()}/watch"
-        response = requests.get(url, stream=True, params={
-                                "publisher_id": self._publisher_id})
+        url = f"{self._url}/{object_type.ALIAS}/watch"
+        response = self._session.get(url, stream=True, params={
+                                     "publisher_id": self._publisher_id})
         for i in response.iter_lines():
-            yield object_type(**json.loads(i))
+            yield object_type.parse_raw(i)
 
     def delete(self, object_type: Any, name: str):
-        url = f"{self._url}/{object_type.get_alias()}/{name}"
-        response = requests.delete(url)
+        url = f"{self._url}/{object_type.ALIAS}/{name}"
+        response = self._session.delete(url)
         common.handle_response(response)
         if object_type == RobotObjectV1:
             try:
@@ -87,27 +106,27 @@ class DatabaseClient:
                 self._logger.info(
                     "Deleting corresponding detection results object.")
                 url = f"{self._url}/detection_results/{name}"
-                response = requests.delete(url)
+                response = self._session.delete(url)
                 common.handle_response(response)
             except objects.common.ICSUsageError as e:
                 self._logger.info(
                     "Caught error (deleting non-existent database object): %s", e)
 
     def cancel_mission(self, name: str):
-        url = f"{self._url}/{MissionObjectV1.get_alias()}/{name}/cancel"
-        response = requests.post(url)
+        url = f"{self._url}/{MissionObjectV1.ALIAS}/{name}/cancel"
+        response = self._session.post(url)
         common.handle_response(response)
 
     def update_mission(self, name: str, update_nodes: Dict[str, MissionRouteNodeV1]):
-        url = f"{self._url}/{MissionObjectV1.get_alias()}/{name}/update"
-        response = requests.post(url, json=update_nodes,
-                                 params={"publisher_id": self._publisher_id})
+        url = f"{self._url}/{MissionObjectV1.ALIAS}/{name}/update"
+        response = self._session.post(url, json=update_nodes,
+                                      params={"publisher_id": self._publisher_id})
         common.handle_response(response)
 
     def is_running(self, timeout: int = 5) -> bool:
         url = f"{self._url}/health"
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=timeout)
             if response.status_code == 200:
                 return True
         except requests.ConnectionError:
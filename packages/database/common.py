@@ -219,7 +219,11 @@ class WebServer:
                        publisher_id: Optional[uuid.UUID] = None):
             if publisher_id is None:
                 publisher_id = uuid.uuid4()
-            obj = object_class(**obj.dict(), status={})
+            # The spec fields were already validated by the create class
+            spec_fields = object_class.get_spec_class().__fields__
+            obj = object_class.from_trusted(
+                **{field: getattr(obj, field) for field in spec_fields},
+                name=obj.name, status=object_class.get_status_class()())
             await self._database.create_object(obj, publisher_id)
             return obj
         return func
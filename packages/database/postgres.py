@@ -21,7 +21,7 @@ import datetime
 import logging
 import sys
 import time
-from typing import Any, AsyncGenerator, Optional, Union
+from typing import Any, AsyncGenerator, List, Optional, Union
 import uuid
 import enum
 
@@ -194,34 +194,36 @@ class PostgresDatabase(common.Database):
     async def list_objects(self, object_class: objects.ApiObjectType,
                            query_params: Optional[pydantic.BaseModel] = None):
         query = f"SELECT * FROM {object_class.table_name()}"
+        # Values for the %s placeholders in the query, bound by the database driver
+        query_values: List[Any] = []
         if query_params and object_class.get_query_map():
             query_map = object_class.get_query_map()
             params_list = []
             extra_clause = ""
+            extra_values: List[Any] = []
             for param, value in query_params:
                 if param == "most_recent" and value is not None:
-                    extra_clause = query_map[param].format(str(value))
+                    extra_clause = query_map[param]
+                    extra_values = [value]
                 elif value is not None:
-                    if isinstance(value, list):
-                        value_str = "('" + "', '".join(value) + "')"
-                    elif isinstance(value, enum.Enum):
-                        value_str = str(value.value)
+                    if isinstance(value, enum.Enum):
+                        value = value.value
                     elif isinstance(value, bool):
-                        value_str = str(value).lower()
+                        value = str(value).lower()
                     elif isinstance(value, datetime.datetime):
-                        value_str = value.isoformat()
-                    else:
-                        value_str = str(value)
-                    params_list.append(query_map[param].format(value_str))
+                        value = value.isoformat()
+                    params_list.append(query_map[param])
+                    query_values.append(value)
             if params_list:
                 query += " WHERE " + " AND ".join(params_list)
             query += extra_clause
+            query_values += extra_values
         query += ";"
 
         connection = await self._get_connection()
         try:
             async with connection.cursor() as cursor:
-                await cursor.execute(query)
+                await cursor.execute(query, query_values)
                 values = await cursor.fetchall()
                 return [object_class(name=name,
                                      lifecycle=objects.ObjectLifecycleV1[lifecycle],
@@ -242,7 +244,7 @@ class PostgresDatabase(common.Database):
                 if values is None:
                     raise fastapi.HTTPException(
                         status_code=400,
-                        detail=f"Did not find \"{object_class.get_alias()}\" with name \"{name}\"")
+                        detail=f"Did not find \"{object_class.ALIAS}\" with name \"{name}\"")
                 obj_name, lifecycle, spec, status = values
                 return object_class(name=obj_name,
                                     lifecycle=objects.ObjectLifecycleV1[lifecycle],
@@ -272,7 +274,7 @@ class PostgresDatabase(common.Database):
             await connection.rollback()
             raise fastapi.HTTPException(
                 400,
-                f"Object {obj.get_alias()} with name {obj.name} already exists") # pylint: disable=raise-missing-from
+                f"Object {obj.ALIAS} with name {obj.name} already exists") # pylint: disable=raise-missing-from
         except Exception as err:  # pylint: disable=broad-except
             self._logger.error("Exit: %s", err)
             traceback.print_exc()